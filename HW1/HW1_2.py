@@ -1,3 +1,15 @@
+import mmap
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from array import array
+from itertools import repeat
+from operator import add, eq, mul
+from typing import Iterable, List, Sequence, Tuple
+
+
 class Rectangle:
     """Class representing a rectangle with width and height"""
 
@@ -33,6 +45,264 @@ class Rectangle:
         self.height = new_height
 
 
+class SlotsRectangle:
+    """Rectangle with __slots__: same methods, no per-instance __dict__"""
+
+    __slots__ = ("width", "height")
+
+    __init__ = Rectangle.__init__
+    area = Rectangle.area
+    perimeter = Rectangle.perimeter
+    is_square = Rectangle.is_square
+    resize = Rectangle.resize
+
+
+class _RectangleColumns:
+    """Whole-collection operations over width and height columns"""
+
+    widths: Sequence[float]
+    heights: Sequence[float]
+
+    def __len__(self) -> int:
+        """Return the number of rectangles"""
+        return len(self.widths)
+
+    def __getitem__(self, index: int) -> Rectangle:
+        """Return a single rectangle as a Rectangle object"""
+        return Rectangle(self.widths[index], self.heights[index])
+
+    def area(self) -> array:
+        """Return the areas of all rectangles"""
+        return array("d", map(mul, self.widths, self.heights))
+
+    def perimeter(self) -> array:
+        """Return the perimeters of all rectangles"""
+        # C-level map chain: no Python-level loop or tuple unpacking
+        return array("d", map(mul, map(add, self.widths, self.heights), repeat(2.0)))
+
+    def is_square(self) -> bytearray:
+        """Return a mask with 1 for every square and 0 otherwise"""
+        return bytearray(map(eq, self.widths, self.heights))
+
+
+class RectangleArray(_RectangleColumns):
+    """
+    Columnar (struct-of-arrays) collection of rectangles
+
+    Widths and heights are kept in two contiguous array('d') columns, so a
+    rectangle costs 16 bytes and the methods work on the whole collection
+    at once instead of one Rectangle at a time.
+    """
+
+    def __init__(self, widths: Iterable[float] = (), heights: Iterable[float] = ()) -> None:
+        """
+        Initialize the collection
+
+        :param widths: Widths of the rectangles
+        :param heights: Heights of the rectangles
+        :raises ValueError: If widths and heights have different lengths
+        """
+        self.widths = array("d", widths)
+        self.heights = array("d", heights)
+        if len(self.widths) != len(self.heights):
+            raise ValueError("widths and heights must have the same length")
+
+    @classmethod
+    def from_rectangles(cls, rectangles: Iterable[Rectangle]) -> "RectangleArray":
+        """
+        Build the collection from Rectangle objects
+
+        :param rectangles: Rectangles to copy
+        :return: New RectangleArray
+        """
+        result = cls()
+        for rect in rectangles:
+            result.append(rect.width, rect.height)
+        return result
+
+    def append(self, width: float, height: float) -> None:
+        """
+        Add one rectangle to the end of the collection
+
+        :param width: Width of the rectangle
+        :param height: Height of the rectangle
+        """
+        self.widths.append(width)
+        self.heights.append(height)
+
+    def resize(
+        self,
+        indices: Sequence[int],
+        new_widths: Sequence[float],
+        new_heights: Sequence[float],
+    ) -> None:
+        """
+        Resize many rectangles at once
+
+        :param indices: Positions of the rectangles to resize
+        :param new_widths: New widths, one per index
+        :param new_heights: New heights, one per index
+        :raises ValueError: If the three sequences have different lengths
+        """
+        if not len(indices) == len(new_widths) == len(new_heights):
+            raise ValueError("indices, new_widths and new_heights must have the same length")
+        widths = self.widths
+        heights = self.heights
+        for i, w, h in zip(indices, new_widths, new_heights):
+            widths[i] = w
+            heights[i] = h
+
+
+class RectangleStore(_RectangleColumns):
+    """
+    Read-only, memory-mapped file of rectangle dimensions
+
+    File layout: an 8-byte header (MAGIC) followed by fixed 16-byte records,
+    each holding width and height as native-endian doubles. widths and
+    heights are strided memoryviews straight into the mapping, so area(),
+    perimeter() and is_square() run without copying the file; a Rectangle
+    object is only created when a single record is indexed.
+    """
+
+    MAGIC = b"RECT\x01\x00\x00\x00"
+    RECORD_SIZE = 2 * array("d").itemsize
+
+    def __init__(self, path: str) -> None:
+        """
+        Open a rectangle file for reading
+
+        :param path: Path to a file written by RectangleStore.append()
+        :raises ValueError: If the file is not a valid rectangle file
+        """
+        self._file = open(path, "rb")
+        self._map = None
+        header = len(self.MAGIC)
+        size = os.fstat(self._file.fileno()).st_size
+        if self._file.read(header) != self.MAGIC or (size - header) % self.RECORD_SIZE:
+            self._file.close()
+            raise ValueError(f"{path} is not a valid rectangle file")
+
+        if size > header:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._views = [memoryview(self._map)]
+        else:
+            self._views = [memoryview(array("d").tobytes())]
+        self._views.append(self._views[0][header:].cast("d"))
+        self.widths = self._views[1][0::2]
+        self.heights = self._views[1][1::2]
+
+    @classmethod
+    def append(cls, path: str, rectangles: RectangleArray) -> int:
+        """
+        Append rectangles to a file, creating it with a header if needed
+
+        :param path: Path to the rectangle file
+        :param rectangles: Rectangles to write
+        :return: Number of rectangles written
+        """
+        records = array("d", bytes(cls.RECORD_SIZE * len(rectangles)))
+        records[0::2] = rectangles.widths
+        records[1::2] = rectangles.heights
+        with open(path, "ab") as file:
+            if file.tell() == 0:
+                file.write(cls.MAGIC)
+            file.write(records.tobytes())
+        return len(rectangles)
+
+    def close(self) -> None:
+        """Release the views and unmap the file"""
+        for view in (self.widths, self.heights, *reversed(self._views)):
+            view.release()
+        if self._map is not None:
+            self._map.close()
+        self._file.close()
+
+    def __enter__(self) -> "RectangleStore":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+
+# ------------------------- Benchmark -------------------------
+
+def _measure(build) -> Tuple[object, int]:
+    """Return the object built by build() and the bytes it allocated"""
+    tracemalloc.start()
+    obj = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return obj, size
+
+
+def benchmark_rectangles(count: int = 1_000_000) -> None:
+    """
+    Compare memory per rectangle and area()/perimeter() throughput of the
+    three layouts
+
+    :param count: Number of rectangles in the benchmark
+    """
+    widths = [float(i % 100 + 1) for i in range(count)]
+    heights = [float(i % 70 + 1) for i in range(count)]
+
+    layouts: List[Tuple[str, object]] = []
+    rects, size = _measure(lambda: [Rectangle(w, h) for w, h in zip(widths, heights)])
+    layouts.append(("Rectangle", rects))
+    print(f"Rectangle:      {size / count:6.1f} bytes per rectangle")
+
+    slots, size = _measure(lambda: [SlotsRectangle(w, h) for w, h in zip(widths, heights)])
+    layouts.append(("SlotsRectangle", slots))
+    print(f"SlotsRectangle: {size / count:6.1f} bytes per rectangle")
+
+    columns, size = _measure(lambda: RectangleArray(widths, heights))
+    print(f"RectangleArray: {size / count:6.1f} bytes per rectangle")
+
+    for method in ("area", "perimeter"):
+        for name, objects in layouts:
+            func = getattr(type(objects[0]), method)  # no getattr() per rectangle
+            start = time.perf_counter()
+            expected = [func(rect) for rect in objects]
+            print(f"{f'{name}.{method}():':<28} {time.perf_counter() - start:.3f} s")
+        start = time.perf_counter()
+        result = getattr(columns, method)()
+        print(f"{f'RectangleArray.{method}():':<28} {time.perf_counter() - start:.3f} s")
+        assert list(result) == expected
+
+
+def benchmark_store(count: int = 1_000_000) -> None:
+    """
+    Compare reloading rectangles from a text file with opening a RectangleStore
+
+    :param count: Number of rectangles in the benchmark files
+    """
+    columns = RectangleArray(
+        [float(i % 100 + 1) for i in range(count)],
+        [float(i % 70 + 1) for i in range(count)],
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, "rectangles.txt")
+        store_path = os.path.join(tmp, "rectangles.bin")
+        with open(text_path, "w", encoding="utf-8") as file:
+            file.writelines(f"{w} {h}\n" for w, h in zip(columns.widths, columns.heights))
+        RectangleStore.append(store_path, columns)
+
+        start = time.perf_counter()
+        with open(text_path, "r", encoding="utf-8") as file:
+            rects = [Rectangle(*map(float, line.split())) for line in file]
+        text_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        with RectangleStore(store_path) as store:
+            open_time = time.perf_counter() - start
+            areas = store.area()
+            area_time = time.perf_counter() - start - open_time
+
+        assert list(areas) == [rect.area() for rect in rects]
+        print(f"Text reload of {count} Rectangle objects: {text_time:.3f} s")
+        print(f"RectangleStore open:  {open_time * 1000:.3f} ms")
+        print(f"RectangleStore area(): {area_time:.3f} s")
+
+
 r = Rectangle(8, 10)
 print("Area", r.area())
 print("Perimeter", r.perimeter())
@@ -42,3 +312,12 @@ r.resize(6, 6)
 print("New size:", r.width, "x", r.height)
 print("Is square?", r.is_square())
 
+rects = RectangleArray([8, 3, 5], [10, 3, 7])
+print("Areas:", list(rects.area()))
+print("Squares:", list(rects.is_square()))
+rects.resize([0, 2], [6, 4], [6, 4])
+print("Squares after resize:", list(rects.is_square()))
+
+if "--bench" in sys.argv[1:]:
+    benchmark_rectangles()
+    benchmark_store()
@@ -1,23 +1,220 @@
 import builtins
-from typing import Any
+import math
+import os
+import sys
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
 
+# Size of the leaf blocks in pairwise summation: each block is added by the
+# built-in sum (C speed), block results are then combined pairwise.
+PAIRWISE_BLOCK: int = 128
 
-def my_sum(*args: Any, **kwargs: Any) -> None:
+
+def _pairwise_sum(values: Sequence[Any]) -> Any:
+    """
+    Pairwise (cascade) summation: error grows as O(log n) instead of O(n).
+    """
+    block = PAIRWISE_BLOCK
+    partials = [builtins.sum(values[i:i + block]) for i in range(0, len(values), block)]
+    while len(partials) > 1:
+        if len(partials) % 2:
+            partials.append(0)
+        partials = [a + b for a, b in zip(partials[0::2], partials[1::2])]
+    return partials[0] if partials else 0
+
+
+def _kahan_sum(values: Iterable[Any]) -> Any:
+    """
+    Kahan-Babuska (Neumaier) compensated summation.
+    """
+    total = 0.0
+    compensation = 0.0
+    for x in values:
+        t = total + x
+        if abs(total) >= abs(x):
+            compensation += (total - t) + x
+        else:
+            compensation += (x - t) + total
+        total = t
+    return total + compensation
+
+
+# Summation methods supported by my_sum()
+METHODS: Dict[str, Callable[[Any], Any]] = {
+    "pairwise": _pairwise_sum,
+    "kahan": _kahan_sum,
+    "exact": math.fsum,
+}
+
+
+def _sum_shared_slice(name: str, start: int, stop: int, method: str) -> Any:
+    """
+    Worker: sum values[start:stop] of a float64 shared memory block.
+    """
+    block = shared_memory.SharedMemory(name=name)
+    try:
+        view = block.buf.cast("d")
+        try:
+            return METHODS[method](view[start:stop].tolist())
+        finally:
+            view.release()
+    finally:
+        block.close()
+
+
+def _is_double_buffer(values: Any) -> bool:
+    """True for array('d') and 1-D memoryviews of C doubles."""
+    if isinstance(values, array):
+        return values.typecode == "d"
+    return isinstance(values, memoryview) and values.format == "d" and values.ndim == 1
+
+
+def _parallel_sum(values: Sequence[float], method: str, workers: int) -> Any:
+    """
+    Copy the floats into shared memory once and sum slices in a process pool.
+
+    array('d') and memoryviews of doubles are copied straight from their
+    buffer; anything else is converted to array('d') first.
+    """
+    data = values if _is_double_buffer(values) else array("d", values)
+    block = shared_memory.SharedMemory(create=True, size=max(len(data) * 8, 1))
+    try:
+        view = block.buf.cast("d")
+        view[:len(data)] = data
+        view.release()
+
+        step = -(-len(data) // workers)
+        bounds = [(i, min(i + step, len(data))) for i in range(0, len(data), step)]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [
+                pool.submit(_sum_shared_slice, block.name, lo, hi, method)
+                for lo, hi in bounds
+            ]
+            partials = [f.result() for f in futures]
+    finally:
+        block.close()
+        block.unlink()
+    # Partial sums are few; combine them with the same method
+    return METHODS[method](partials)
+
+
+def _all_floats(values: Sequence[Any]) -> bool:
+    """True if every value is a float, so a float64 copy changes nothing."""
+    if isinstance(values, array):
+        return values.typecode in "fd"
+    if isinstance(values, memoryview):
+        return values.format in ("d", "f")
+    return all(type(x) is float for x in values)
+
+
+def my_sum(
+    iterable: Iterable[Any],
+    /,
+    start: Any = 0,
+    *,
+    method: str = "pairwise",
+    workers: Optional[int] = None,
+    parallel_threshold: int = 2_000_000,
+) -> Any:
+    """
+    Accurate replacement for the built-in sum.
+
+    Args:
+        iterable: Numbers to add (list, tuple, array, memoryview or any iterable).
+        start: Value added to the result, as in builtins.sum.
+        method: "pairwise" (default), "kahan" (compensated) or "exact" (math.fsum).
+        workers: Number of processes for large float inputs; None means
+            os.cpu_count(), 1 disables the process pool.
+        parallel_threshold: Minimal number of values to use the process pool.
+
+    Returns:
+        The sum of start and all values ("kahan" and "exact" return a float).
+
+    Raises:
+        ValueError: If method is unknown.
+    """
+    if method not in METHODS:
+        raise ValueError(f"Unknown summation method: {method}")
+
+    values = iterable
+    if isinstance(values, memoryview):
+        if values.ndim != 1:
+            values = values.cast("B").cast(values.format)
+        if values.format not in ("d", "f"):
+            values = values.tolist()
+    elif not isinstance(values, (list, tuple, array)):
+        values = list(values)
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if (
+        workers > 1
+        and method != "exact"  # math.fsum is exact only over the whole input
+        and values
+        and len(values) >= parallel_threshold
+        and _all_floats(values)
+    ):
+        total = _parallel_sum(values, method, workers)
+    else:
+        total = METHODS[method](values)
+
+    if start == 0:
+        return total
+    return METHODS[method]([start, total])
+
+
+# ------------------------- Benchmark -------------------------
+
+def benchmark_sum(sizes: Sequence[int] = (1_000, 100_000, 1_000_000, 5_000_000)) -> None:
     """
-    Custom function that demonstrates overriding a built-in function name.
-    Instead of summing, it simply prints a message.
+    Compare builtins.sum with my_sum for several sizes, dtypes and methods.
+
+    The error column is the distance from the exact result (math.fsum).
     """
-    print("This is my custom sum function!")
+    def inputs(n: int) -> Dict[str, Any]:
+        floats = [((i * 7919) % 1000) / 7.0 + 1e-9 * i for i in range(n)]
+        return {
+            "list[int]": list(range(n)),
+            "list[float]": floats,
+            "array('d')": array("d", floats),
+        }
+
+    print(f"{'size':>9} {'dtype':<12} {'variant':<16} {'time, s':>9} {'error':>10}")
+    for n in sizes:
+        for dtype, data in inputs(n).items():
+            exact = math.fsum(data)
+            variants: List[tuple] = [("builtins.sum", lambda: builtins.sum(data))]
+            for method in METHODS:
+                variants.append((method, lambda m=method: my_sum(data, method=m, workers=1)))
+            variants.append(("pairwise x pool", lambda: my_sum(data, parallel_threshold=0)))
+            for label, run in variants:
+                begin = time.perf_counter()
+                result = run()
+                elapsed = time.perf_counter() - begin
+                error = abs(result - exact)
+                print(f"{n:>9} {dtype:<12} {label:<16} {elapsed:>9.4f} {error:>10.3g}")
+
+
+if __name__ == "__main__":
+    # Create a list of numbers
+    numbers: list[int] = [1, 2, 3, 4, 5]
 
+    # Call the built-in sum function to add up the numbers
+    print("Calling the built-in sum:", builtins.sum(numbers))
 
-# Create a list of numbers
-numbers: list[int] = [1, 2, 3, 4, 5]
+    # Call our custom my_sum function
+    print("Calling my_sum:", my_sum(numbers))
 
-# Call the built-in sum function to add up the numbers
-print("Calling the built-in sum:", builtins.sum(numbers))
+    # Floats: built-in sum loses precision, my_sum does not
+    tenths: list[float] = [0.1] * 10
+    print("builtins.sum([0.1] * 10):", builtins.sum(tenths))
+    print("my_sum([0.1] * 10, method='exact'):", my_sum(tenths, method="exact"))
 
-# Call our custom my_sum function
-my_sum(numbers)
+    # Call the built-in sum again
+    print("Calling the built-in sum again:", builtins.sum(numbers))
 
-# Call the built-in sum again
-print("Calling the built-in sum again:", builtins.sum(numbers))
+    if "--bench" in sys.argv[1:]:
+        benchmark_sum()
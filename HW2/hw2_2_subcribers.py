@@ -1,12 +1,267 @@
-from typing import List
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import unicodedata
+from typing import Any, Awaitable, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 
-# Global variable that stores the list of subscribers
-subscribers: List[str] = []
+
+class SubscriberRegistry:
+    """
+    Insertion-ordered, hash-indexed set of subscribers.
+
+    Names are indexed by their normalized form (NFC, stripped, casefolded),
+    so membership, lookup and removal are O(1) and "Олена", " олена " and
+    "ОЛЕНА" are the same subscriber. The name as first subscribed is kept
+    for display.
+    """
+
+    __slots__ = ("_by_key",)
+
+    def __init__(self, names: Iterable[str] = ()) -> None:
+        self._by_key: Dict[str, str] = {}
+        for name in names:
+            self.add(name)
+
+    @staticmethod
+    def normalize(name: str) -> str:
+        """Return the lookup key for a subscriber name."""
+        return unicodedata.normalize("NFC", name).strip().casefold()
+
+    def add(self, name: str) -> bool:
+        """Add a subscriber. Returns False if already subscribed."""
+        key = self.normalize(name)
+        if key in self._by_key:
+            return False
+        self._by_key[key] = name
+        return True
+
+    def discard(self, name: str) -> bool:
+        """Remove a subscriber. Returns False if not subscribed."""
+        return self._by_key.pop(self.normalize(name), None) is not None
+
+    def get(self, name: str) -> Optional[str]:
+        """Return the stored name matching name after normalization, or None."""
+        return self._by_key.get(self.normalize(name))
+
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self.normalize(name) in self._by_key
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._by_key.values())
+
+    def __len__(self) -> int:
+        return len(self._by_key)
+
+    def __repr__(self) -> str:
+        return repr(list(self._by_key.values()))
+
+
+# Global variable that stores the subscribers
+subscribers: SubscriberRegistry = SubscriberRegistry()
+
+
+# ------------------------- Persistence -------------------------
+
+_ESCAPES = str.maketrans({"\\": "\\\\", "\n": "\\n", "\r": "\\r", "\t": "\\t"})
+_UNESCAPES = {"\\": "\\", "n": "\n", "r": "\r", "t": "\t"}
+
+
+def _escape(text: str) -> str:
+    """Escape backslash, CR, LF and tab so a value fits in one record field."""
+    return text.translate(_ESCAPES)
+
+
+def _unescape(text: str) -> str:
+    """Inverse of _escape()."""
+    if "\\" not in text:
+        return text
+    out: List[str] = []
+    chars = iter(text)
+    for ch in chars:
+        if ch == "\\":
+            ch = _UNESCAPES.get(next(chars, "\\"), "\\")
+        out.append(ch)
+    return "".join(out)
+
+
+def _drop_torn_tail(path: str) -> None:
+    """
+    Truncate the journal after its last complete record.
+
+    A record ("+key<TAB>name" or "-key") is only complete with its "\n".
+    load() ignores an unterminated one, but the next record() would extend
+    it into a garbled line, so it is removed before the journal is reopened.
+    """
+    with open(path, "rb+") as file:
+        end = file.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            step = min(4096, position)
+            file.seek(position - step)
+            newline = file.read(step).rfind(b"\n")
+            if newline >= 0:
+                position = position - step + newline + 1
+                break
+            position -= step
+        if position != end:
+            file.truncate(position)
+
+
+class SubscriberLog:
+    """
+    Append-only journal of subscribe/unsubscribe operations plus snapshots.
+
+    Files in `directory`:
+        subscribers.snapshot - "key<TAB>name" per line, the compacted state
+        subscribers.journal  - "+key<TAB>name" or "-key" per operation
+                               since the snapshot was written
+
+    Both files use "\n" line endings only (no newline translation) and
+    escape CR, LF, tab and backslash inside fields. A partial last journal
+    line left by a crash is cut off when the log is opened.
+
+    load() reads the snapshot in blocks of whole lines, builds the registry
+    from it and replays only the journal tail. Every `compact_every` journal records the state is
+    written to a new snapshot (temp file + os.replace) and the journal is
+    truncated. Replaying a journal over a state that already contains it
+    gives the same state, so a crash between those two steps loses nothing.
+    """
+
+    SNAPSHOT = "subscribers.snapshot"
+    JOURNAL = "subscribers.journal"
+    LOAD_CHUNK = 1 << 20  # characters of the snapshot parsed at once
+
+    def __init__(
+        self,
+        directory: str,
+        registry: Optional[SubscriberRegistry] = None,
+        compact_every: int = 1_000_000,
+        fsync: bool = False,
+    ) -> None:
+        os.makedirs(directory, exist_ok=True)
+        self.registry = registry if registry is not None else SubscriberRegistry()
+        self.compact_every = compact_every
+        self.fsync = fsync
+        self._directory = directory
+        self._snapshot_path = os.path.join(directory, self.SNAPSHOT)
+        self._journal_path = os.path.join(directory, self.JOURNAL)
+        if os.path.exists(self._journal_path):
+            _drop_torn_tail(self._journal_path)
+        self._journal = open(self._journal_path, "a", encoding="utf-8", newline="\n")
+        self._records = 0
+
+    def load(self) -> SubscriberRegistry:
+        """Rebuild the registry from the snapshot and the journal tail."""
+        by_key = self.registry._by_key
+        by_key.clear()
+        if os.path.exists(self._snapshot_path):
+            with open(self._snapshot_path, "r", encoding="utf-8", newline="\n") as file:
+                rest = ""  # partial last line of the previous block
+                while True:
+                    # About 1 MiB at a time, cut at the last newline: one
+                    # split per block, so extra memory does not grow with
+                    # the file
+                    block = file.read(self.LOAD_CHUNK)
+                    if not block:
+                        break
+                    block = rest + block
+                    cut = block.rfind("\n") + 1
+                    rest = block[cut:]
+                    if not cut:
+                        continue
+                    # "k1 n1 k2 n2 ..." -> pairs
+                    fields = block[:cut].replace("\n", "\t").split("\t")
+                    fields.pop()  # after the trailing newline
+                    if "\\" in block:
+                        fields = [_unescape(field) for field in fields]
+                    it = iter(fields)
+                    by_key.update(zip(it, it))
+
+        self._records = 0
+        with open(self._journal_path, "r", encoding="utf-8", newline="\n") as journal:
+            for line in journal:
+                if not line.endswith("\n"):
+                    break  # torn last write
+                head, _, name = line[:-1].partition("\t")
+                op = head[:1]
+                if op == "+":
+                    by_key.setdefault(_unescape(head[1:]), _unescape(name))
+                elif op == "-":
+                    by_key.pop(_unescape(head[1:]), None)
+                else:
+                    continue  # blank or unknown line
+                self._records += 1
+        return self.registry
+
+    def record(self, op: str, names: Iterable[str]) -> None:
+        """
+        Append operations to the journal.
+
+        Args:
+            op (str): "+" for subscribe, "-" for unsubscribe.
+            names (Iterable[str]): Names the operation was applied to.
+        """
+        normalize = SubscriberRegistry.normalize
+        if op == "+":
+            lines = [f"+{_escape(normalize(n))}\t{_escape(n)}\n" for n in names]
+        else:
+            lines = [f"-{_escape(normalize(n))}\n" for n in names]
+        if not lines:
+            return
+        self._journal.writelines(lines)
+        self._journal.flush()
+        if self.fsync:
+            os.fsync(self._journal.fileno())
+        self._records += len(lines)
+        if self._records >= self.compact_every:
+            self.compact()
+
+    def compact(self) -> None:
+        """Write the current state to a new snapshot and empty the journal."""
+        fd, tmp_path = tempfile.mkstemp(dir=self._directory, prefix=".snapshot-")
+        with os.fdopen(fd, "w", encoding="utf-8", newline="\n") as file:
+            file.writelines(
+                f"{_escape(key)}\t{_escape(name)}\n"
+                for key, name in self.registry._by_key.items()
+            )
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self._snapshot_path)
+        self._journal.truncate(0)
+        self._journal.seek(0)
+        self._records = 0
+
+    def close(self) -> None:
+        """Close the journal file."""
+        self._journal.close()
+
+
+# Optional persistence of the global subscribers (see open_subscriber_log)
+subscriber_log: Optional[SubscriberLog] = None
+
+
+def open_subscriber_log(directory: str, **options: Any) -> SubscriberLog:
+    """
+    Restore the global subscribers from `directory` and journal later changes there.
+
+    Args:
+        directory (str): Directory with the snapshot and journal files.
+        **options: Extra keyword arguments for SubscriberLog.
+
+    Returns:
+        SubscriberLog: The opened log.
+    """
+    global subscriber_log
+    subscriber_log = SubscriberLog(directory, subscribers, **options)
+    subscriber_log.load()
+    return subscriber_log
 
 
 def subscribe(name: str) -> str:
     """
-    Add a subscriber to the global subscribers list.
+    Add a subscriber to the global subscribers registry.
 
     Inside this function, a nested function confirm_subscription()
     is defined, which returns a confirmation message for the given subscriber.
@@ -20,7 +275,8 @@ def subscribe(name: str) -> str:
     if not name.strip():
         return "Ім’я підписника не може бути порожнім."
 
-    subscribers.append(name)
+    if subscribers.add(name) and subscriber_log is not None:
+        subscriber_log.record("+", [name])
 
     def confirm_subscription() -> str:
         """
@@ -34,7 +290,7 @@ def subscribe(name: str) -> str:
 
 def unsubscribe(name: str) -> str:
     """
-    Remove a subscriber from the global subscribers list if present.
+    Remove a subscriber from the global subscribers registry if present.
 
     Args:
         name (str): The name of the subscriber to remove.
@@ -42,16 +298,307 @@ def unsubscribe(name: str) -> str:
     Returns:
         str: Result message.
     """
-    if name in subscribers:
-        subscribers.remove(name)
+    if subscribers.discard(name):
+        if subscriber_log is not None:
+            subscriber_log.record("-", [name])
         return f"{name} успішно відписаний"
     return f"{name} не знайдено у списку підписників"
 
 
-# Example usage
-print(subscribe("Олена"))   # Підписка підтверджена для Олена
-print(subscribe("Ігор"))    # Підписка підтверджена для Ігор
-print(subscribers)          # ['Олена', 'Ігор']
+def subscribe_many(names: Iterable[str]) -> List[str]:
+    """
+    Subscribe many names at once.
+
+    Args:
+        names (Iterable[str]): Names of the subscribers.
+
+    Returns:
+        List[str]: One result message per name, in input order
+        (the same messages as subscribe()).
+    """
+    results: List[str] = []
+    added: List[str] = []
+    add = subscribers.add
+    for name in names:
+        if not name.strip():
+            results.append("Ім’я підписника не може бути порожнім.")
+            continue
+        if add(name):
+            added.append(name)
+        results.append(f"Підписка підтверджена для {name}")
+    if subscriber_log is not None:
+        subscriber_log.record("+", added)
+    return results
+
+
+def unsubscribe_many(names: Iterable[str]) -> List[str]:
+    """
+    Unsubscribe many names at once.
+
+    Args:
+        names (Iterable[str]): Names of the subscribers to remove.
+
+    Returns:
+        List[str]: One result message per name, in input order
+        (the same messages as unsubscribe()).
+    """
+    results: List[str] = []
+    removed: List[str] = []
+    discard = subscribers.discard
+    for name in names:
+        if discard(name):
+            removed.append(name)
+            results.append(f"{name} успішно відписаний")
+        else:
+            results.append(f"{name} не знайдено у списку підписників")
+    if subscriber_log is not None:
+        subscriber_log.record("-", removed)
+    return results
+
+
+# ------------------------- Async confirmation delivery -------------------------
+
+# A sink receives one batch of confirmation messages and delivers it
+Sink = Callable[[List[str]], Awaitable[None]]
+
+
+class MemorySink:
+    """Sink that keeps delivered messages in memory (for tests and demos)."""
+
+    def __init__(self) -> None:
+        self.messages: List[str] = []
+        self.batches: int = 0
+
+    async def __call__(self, batch: List[str]) -> None:
+        self.messages.extend(batch)
+        self.batches += 1
+
+
+class FileSink:
+    """Sink that appends each batch to a local file, one message per line."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+
+    def _write(self, batch: List[str]) -> None:
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("\n".join(batch) + "\n")
+
+    async def __call__(self, batch: List[str]) -> None:
+        await asyncio.to_thread(self._write, batch)
+
+
+class DeliveryStats:
+    """Counters of a ConfirmationDispatcher."""
+
+    def __init__(self) -> None:
+        self.submitted: int = 0
+        self.rejected: int = 0
+        self.delivered: int = 0
+        self.failed: int = 0
+        self.batches: int = 0
+        self.latency_total: float = 0.0
+        self.latency_max: float = 0.0
+        self.started: float = time.perf_counter()
+
+    @property
+    def latency_avg(self) -> float:
+        """Average seconds from submit to delivery."""
+        return self.latency_total / self.delivered if self.delivered else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Delivered messages per second since the dispatcher started."""
+        elapsed = time.perf_counter() - self.started
+        return self.delivered / elapsed if elapsed > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return (
+            f"DeliveryStats(submitted={self.submitted}, rejected={self.rejected}, "
+            f"delivered={self.delivered}, failed={self.failed}, batches={self.batches}, "
+            f"latency_avg={self.latency_avg * 1000:.2f}ms, "
+            f"latency_max={self.latency_max * 1000:.2f}ms, "
+            f"throughput={self.throughput:.0f}/s)"
+        )
+
+
+class ConfirmationDispatcher:
+    """
+    Delivers confirmation messages to a sink in batches.
+
+    Messages wait in a bounded asyncio.Queue. submit() waits while the
+    queue is full (backpressure), try_submit() drops the message instead.
+    `concurrency` worker tasks each take up to `batch_size` queued messages
+    and pass them to the sink in one call.
+    """
+
+    def __init__(
+        self,
+        sink: Sink,
+        *,
+        batch_size: int = 100,
+        max_queue: int = 10_000,
+        concurrency: int = 4,
+    ) -> None:
+        if batch_size < 1 or max_queue < 1 or concurrency < 1:
+            raise ValueError("batch_size, max_queue and concurrency must be >= 1")
+        self.sink = sink
+        self.batch_size = batch_size
+        self.concurrency = concurrency
+        self.stats = DeliveryStats()
+        self._queue: "asyncio.Queue[Tuple[str, float]]" = asyncio.Queue(max_queue)
+        self._workers: List[asyncio.Task] = []
+
+    async def __aenter__(self) -> "ConfirmationDispatcher":
+        self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def start(self) -> None:
+        """Start the worker tasks (must be called inside a running loop)."""
+        if not self._workers:
+            self.stats.started = time.perf_counter()  # counts are kept
+            self._workers = [
+                asyncio.create_task(self._worker()) for _ in range(self.concurrency)
+            ]
+
+    async def submit(self, message: str) -> None:
+        """Queue a message, waiting while the queue is full."""
+        await self._queue.put((message, time.perf_counter()))
+        self.stats.submitted += 1
+
+    def try_submit(self, message: str) -> bool:
+        """Queue a message without waiting. Returns False if the queue is full."""
+        try:
+            self._queue.put_nowait((message, time.perf_counter()))
+        except asyncio.QueueFull:
+            self.stats.rejected += 1
+            return False
+        self.stats.submitted += 1
+        return True
+
+    async def close(self) -> None:
+        """
+        Deliver everything still queued and stop the workers.
+
+        Workers are started first if needed, so messages submitted before
+        start() are delivered too instead of waiting forever.
+        """
+        if not self._queue.empty():
+            self.start()
+        await self._queue.join()
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self) -> None:
+        queue = self._queue
+        stats = self.stats
+        while True:
+            items = [await queue.get()]
+            while len(items) < self.batch_size and not queue.empty():
+                items.append(queue.get_nowait())
+            try:
+                await self.sink([message for message, _ in items])
+            except Exception:
+                stats.failed += len(items)
+            else:
+                now = time.perf_counter()
+                stats.delivered += len(items)
+                stats.batches += 1
+                for _, queued_at in items:
+                    latency = now - queued_at
+                    stats.latency_total += latency
+                    if latency > stats.latency_max:
+                        stats.latency_max = latency
+            finally:
+                for _ in items:
+                    queue.task_done()
+
+
+async def subscribe_async(name: str, dispatcher: ConfirmationDispatcher) -> str:
+    """
+    Subscribe a name and queue its confirmation for delivery.
+
+    The caller only waits when the dispatcher queue is full.
+
+    Args:
+        name (str): The name of the subscriber.
+        dispatcher (ConfirmationDispatcher): Started dispatcher.
+
+    Returns:
+        str: Confirmation message (as returned by subscribe()).
+    """
+    message = subscribe(name)
+    if name.strip():
+        await dispatcher.submit(message)
+    return message
+
+
+# ------------------------- Benchmark -------------------------
+
+def benchmark_restart(count: int = 10_000_000, tail: int = 100_000) -> None:
+    """
+    Compare rebuilding the registry from raw names with SubscriberLog.load().
+
+    Args:
+        count (int): Number of subscribers in the snapshot.
+        tail (int): Number of journal records written after the snapshot.
+    """
+    names = [f"Subscriber {i}" for i in range(count)]
+    with tempfile.TemporaryDirectory() as directory:
+        # Baseline: a plain dump of names, as fetched from upstream
+        dump_path = os.path.join(directory, "names.txt")
+        with open(dump_path, "w", encoding="utf-8") as file:
+            file.writelines(f"{name}\n" for name in names)
+
+        start = time.perf_counter()
+        with open(dump_path, "r", encoding="utf-8") as file:
+            registry = SubscriberRegistry(file.read().splitlines())
+        rebuild_time = time.perf_counter() - start
+
+        log = SubscriberLog(directory, registry, compact_every=count + tail + 1)
+        log.compact()
+        log.record("-", names[:tail // 2])
+        log.record("+", [f"Late {i}" for i in range(tail - tail // 2)])
+        log.close()
+        del registry
+
+        start = time.perf_counter()
+        restored = SubscriberLog(directory).load()
+        load_time = time.perf_counter() - start
+
+    print(f"Subscribers: {len(restored)} (snapshot {count} + journal {tail})")
+    print(f"Rebuild from a names dump: {rebuild_time:.2f} s")
+    print(f"Snapshot + journal: {load_time:.2f} s ({rebuild_time / load_time:.1f}x)")
+
+
+async def _demo_delivery() -> None:
+    sink = MemorySink()
+    async with ConfirmationDispatcher(sink, batch_size=2, concurrency=2) as dispatcher:
+        for name in ["Ірина", "Олег", "Тарас"]:
+            await subscribe_async(name, dispatcher)
+    print(sink.messages)
+    print(dispatcher.stats)
+
+
+if __name__ == "__main__":
+    # Example usage
+    print(subscribe("Олена"))   # Підписка підтверджена для Олена
+    print(subscribe("Ігор"))    # Підписка підтверджена для Ігор
+    print(subscribers)          # ['Олена', 'Ігор']
+
+    print(unsubscribe("Ігор"))  # Ігор успішно відписаний
+    print(subscribers)          # ['Олена']
+
+    print(subscribe_many(["Марія", "", "Андрій"]))
+    print(unsubscribe_many(["марія", "Петро"]))
+    print(subscribers)          # ['Олена', 'Андрій']
+
+    asyncio.run(_demo_delivery())
 
-print(unsubscribe("Ігор"))  # Ігор успішно відписаний
-print(subscribers)          # ['Олена']
+    if "--bench" in sys.argv[1:]:
+        benchmark_restart()
@@ -1,8 +1,17 @@
 # Task 3: Store order system with discounts
 
+import sys
+import time
+from array import array
+from bisect import bisect_right
+from typing import Iterable, Optional, Sequence, Tuple
+
 # Global discount (10%)
 discount: float = 0.10
 
+# Additional VIP discount (5%), as in create_order()
+vip_discount: float = 0.05
+
 
 def create_order(price: float) -> None:
     """
@@ -27,7 +36,6 @@ def create_order(price: float) -> None:
         Uses 'nonlocal' to modify final_price in enclosing scope.
         """
         nonlocal final_price
-        vip_discount: float = 0.05
         final_price = final_price * (1 - vip_discount)
 
     # Save the price with only the global discount
@@ -42,10 +50,128 @@ def create_order(price: float) -> None:
     print(f"Ціна зі знижкою {int(discount * 100)}%: {regular_price:.2f}")
     print(
         f"Ціна зі знижкою {int(discount * 100)}% + "
-        f"додатково 5% для VIP: {vip_price:.2f}"
+        f"додатково {int(vip_discount * 100)}% для VIP: {vip_price:.2f}"
     )
 
 
+class DiscountRules:
+    """
+    Compiled discount rule table for batch pricing.
+
+    The price of an order goes through the same steps as in create_order():
+    regular = price * (1 - global discount) * (1 - tier discount)
+    vip     = regular * (1 - VIP discount)
+    Tiers are (min_price, discount) pairs; an order gets the discount of the
+    highest tier whose min_price is not above its price. They are compiled
+    once into sorted threshold and factor tables.
+    """
+
+    def __init__(
+        self,
+        global_discount: Optional[float] = None,
+        vip: Optional[float] = None,
+        tiers: Iterable[Tuple[float, float]] = (),
+    ) -> None:
+        """
+        Args:
+            global_discount (float | None): Base discount; None means the
+                module-level `discount` at construction time.
+            vip (float | None): VIP discount; None means `vip_discount`.
+            tiers (Iterable[tuple[float, float]]): (min_price, discount) pairs.
+
+        Raises:
+            ValueError: If a discount is outside [0, 1].
+        """
+        self.global_discount = discount if global_discount is None else global_discount
+        self.vip = vip_discount if vip is None else vip
+        ordered = sorted(tiers)
+        for rate in [self.global_discount, self.vip, *(rate for _, rate in ordered)]:
+            if not 0 <= rate <= 1:
+                raise ValueError(f"Знижка має бути в межах [0, 1]: {rate}")
+        self.thresholds: Tuple[float, ...] = tuple(low for low, _ in ordered)
+        # factors[i] applies to prices below thresholds[i] (index from bisect)
+        self.tier_factors: Tuple[float, ...] = (1.0,) + tuple(1 - rate for _, rate in ordered)
+        self.global_factor: float = 1 - self.global_discount
+        self.vip_factor: float = 1 - self.vip
+
+
+def price_orders(
+    prices: Sequence[float],
+    rules: Optional[DiscountRules] = None,
+) -> Tuple[array, array]:
+    """
+    Price many orders in one pass, without printing.
+
+    Results are rounded to 2 decimals, the same values create_order() prints.
+
+    Args:
+        prices (Sequence[float]): Initial prices (list, array('d'), ...).
+        rules (DiscountRules | None): Rule table; None uses the module-level
+            discount and VIP discount without tiers.
+
+    Returns:
+        tuple[array, array]: Regular and VIP price columns (array('d')).
+
+    Raises:
+        ValueError: If any price is negative.
+    """
+    if rules is None:
+        rules = DiscountRules()
+    if len(prices) and min(prices) < 0:
+        raise ValueError("Ціна не може бути від'ємною.")
+
+    base = rules.global_factor
+    vip = rules.vip_factor
+    if rules.thresholds:
+        thresholds = rules.thresholds
+        factors = rules.tier_factors
+        regular = [p * base * factors[bisect_right(thresholds, p)] for p in prices]
+    else:
+        regular = [p * base for p in prices]
+    vip_prices = array("d", [round(p * vip, 2) for p in regular])
+    return array("d", [round(p, 2) for p in regular]), vip_prices
+
+
+# ------------------------- Benchmark -------------------------
+
+def benchmark_pricing(count: int = 1_000_000) -> None:
+    """
+    Compare the create_order() computation per order with price_orders().
+
+    Args:
+        count (int): Number of orders.
+    """
+    prices = array("d", (((i * 7919) % 100_000) / 100 for i in range(count)))
+
+    start = time.perf_counter()
+    expected = []
+    for price in prices:
+        final_price = price * (1 - discount)
+        regular_price = final_price
+        final_price = final_price * (1 - vip_discount)
+        expected.append((round(regular_price, 2), round(final_price, 2)))
+    loop_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    regular, vip = price_orders(prices)
+    batch_time = time.perf_counter() - start
+
+    assert list(zip(regular, vip)) == expected
+    print(f"Orders: {count}")
+    print(f"Per-order loop: {loop_time:.3f} s")
+    print(f"price_orders:   {batch_time:.3f} s ({loop_time / batch_time:.1f}x)")
+
+
 # Example usage
 create_order(1000.0)   # OK
 # create_order(-500.0)  # Raises ValueError
+
+regular, vip = price_orders([1000.0, 250.0, 80.0])
+print("Звичайні ціни:", list(regular))   # [900.0, 225.0, 72.0]
+print("Ціни для VIP:", list(vip))        # [855.0, 213.75, 68.4]
+
+rules = DiscountRules(tiers=[(200.0, 0.02), (900.0, 0.05)])
+print("З рівнями знижок:", price_orders([1000.0, 250.0, 80.0], rules))
+
+if "--bench" in sys.argv[1:]:
+    benchmark_pricing()
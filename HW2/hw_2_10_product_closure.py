@@ -1,12 +1,244 @@
-from typing import Callable, Tuple
+import math
+import operator
+import sys
+import time
+import tracemalloc
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Callable, Iterable, List, Optional, Tuple, Union
 
 
-def create_product(name: str, price: float, quantity: int) -> Tuple[
+class ProductCatalog:
+    """
+    Columnar storage for many products.
+
+    Product i is names[i], prices[i] (array 'd') and quantities[i] (array 'q');
+    a product costs two array slots plus a list slot, instead of two
+    closures and a cell. A sorted price index (parallel arrays of prices
+    and ids) answers price-range queries with two binary searches.
+
+    add() only appends to the columns; new ids are put into the index by
+    the next query, one by one (O(n) each) if they are few or with one
+    O(n log n) re-sort otherwise, so building a catalog with add() in a
+    loop is not quadratic. remove() leaves an empty slot, so product ids
+    never change.
+    """
+
+    # Bulk updates touching more than 1/REBUILD_FRACTION of the products
+    # re-sort the index once instead of moving entries one by one
+    REBUILD_FRACTION = 8
+
+    def __init__(self) -> None:
+        self.names: List[Optional[str]] = []  # None for removed products
+        self.prices = array("d")
+        self.quantities = array("q")
+        self._index_prices = array("d")  # sorted
+        self._index_ids = array("q")     # product id for each _index_prices entry
+        self._unindexed: List[int] = []  # ids added since the index was updated
+        self._removed = 0
+
+    def __len__(self) -> int:
+        """Number of products that have not been removed."""
+        return len(self.names) - self._removed
+
+    def _check(self, product_id: int) -> None:
+        if not 0 <= product_id < len(self.names) or self.names[product_id] is None:
+            raise IndexError(f"Товар з id {product_id} не знайдено")
+
+    def add(self, name: str, price: float, quantity: int) -> int:
+        """Add a product and return its id (indexed lazily, see the class docs)."""
+        product_id = len(self.names)
+        self.names.append(name)
+        self.prices.append(price)
+        self.quantities.append(quantity)
+        self._unindexed.append(product_id)
+        return product_id
+
+    def add_many(self, products: Iterable[Tuple[str, float, int]]) -> range:
+        """
+        Add many (name, price, quantity) products; return their ids.
+
+        The new ids are indexed right away by _sync_index: one by one for a
+        small batch, with one re-sort if the batch is large.
+        """
+        first = len(self.names)
+        for name, price, quantity in products:
+            self.names.append(name)
+            self.prices.append(price)
+            self.quantities.append(quantity)
+        self._unindexed.extend(range(first, len(self.names)))
+        self._sync_index()
+        return range(first, len(self.names))
+
+    def _rebuild_index(self) -> None:
+        """Sort all ids by price: O(n log n)."""
+        prices, names = self.prices, self.names
+        ids = range(len(prices))
+        if self._removed:
+            ids = [i for i in ids if names[i] is not None]
+        order = sorted(ids, key=prices.__getitem__)
+        self._index_ids = array("q", order)
+        self._index_prices = array("d", map(prices.__getitem__, order))
+        self._unindexed.clear()
+
+    def _sync_index(self) -> None:
+        """Put the ids added since the last update into the price index."""
+        pending = self._unindexed
+        if not pending:
+            return
+        if len(pending) * self.REBUILD_FRACTION > len(self.names):
+            self._rebuild_index()
+            return
+        for product_id in pending:
+            price = self.prices[product_id]
+            position = bisect_right(self._index_prices, price)
+            self._index_prices.insert(position, price)
+            self._index_ids.insert(position, product_id)
+        pending.clear()
+
+    def _unindex(self, product_id: int) -> None:
+        """Remove one product from the price index."""
+        self._sync_index()
+        price = self.prices[product_id]
+        lo = bisect_left(self._index_prices, price)
+        hi = bisect_right(self._index_prices, price, lo)
+        position = self._index_ids.index(product_id, lo, hi)
+        del self._index_prices[position]
+        del self._index_ids[position]
+
+    def remove(self, product_id: int) -> None:
+        """
+        Remove a product: it leaves the index and its slot is emptied
+        (name None, price and quantity 0); the other ids stay valid.
+
+        Raises:
+            IndexError: If there is no such product.
+        """
+        self._check(product_id)
+        self._unindex(product_id)
+        self.names[product_id] = None
+        self.prices[product_id] = 0.0
+        self.quantities[product_id] = 0
+        self._removed += 1
+
+    def update_price(self, product_id: int, new_price: float) -> None:
+        """Change one price and move the product within the index."""
+        self._check(product_id)
+        self._unindex(product_id)
+        self.prices[product_id] = new_price
+        position = bisect_right(self._index_prices, new_price)
+        self._index_prices.insert(position, new_price)
+        self._index_ids.insert(position, product_id)
+
+    def update_prices(self, product_ids: Iterable[int],
+                      new_prices: Union[float, Iterable[float]]) -> None:
+        """
+        Change the prices of many products.
+
+        Args:
+            product_ids: Products to update.
+            new_prices: One price for all of them, or one price per id.
+        """
+        ids = list(product_ids)
+        if isinstance(new_prices, (int, float)):
+            values = [float(new_prices)] * len(ids)
+        else:
+            values = list(new_prices)
+            if len(values) != len(ids):
+                raise ValueError("Кількість цін не збігається з кількістю товарів")
+        for product_id in ids:
+            self._check(product_id)
+        if len(ids) * self.REBUILD_FRACTION > len(self.names):
+            for product_id, price in zip(ids, values):
+                self.prices[product_id] = price
+            self._rebuild_index()
+        else:
+            for product_id, price in zip(ids, values):
+                self.update_price(product_id, price)
+
+    def price_range(self, low: float, high: float) -> array:
+        """Ids of products with low <= price <= high, cheapest first: O(log n + k)."""
+        self._sync_index()
+        lo = bisect_left(self._index_prices, low)
+        hi = bisect_right(self._index_prices, high, lo)
+        return self._index_ids[lo:hi]
+
+    def count_in_range(self, low: float, high: float) -> int:
+        """Number of products with low <= price <= high: O(log n)."""
+        self._sync_index()
+        lo = bisect_left(self._index_prices, low)
+        return bisect_right(self._index_prices, high, lo) - lo
+
+    def stock_value(self, product_ids: Optional[Iterable[int]] = None) -> float:
+        """Sum of price * quantity over all products (or the given ids)."""
+        if product_ids is None:
+            return math.fsum(map(operator.mul, self.prices, self.quantities))
+        prices, quantities = self.prices, self.quantities
+        return math.fsum(prices[i] * quantities[i] for i in product_ids)
+
+    def view(self, product_id: int) -> "ProductView":
+        """Return a lightweight handle to one product."""
+        self._check(product_id)
+        return ProductView(self, product_id)
+
+
+class ProductView:
+    """A product as (catalog, id): reads and writes go to the catalog."""
+
+    __slots__ = ("catalog", "product_id")
+
+    def __init__(self, catalog: ProductCatalog, product_id: int) -> None:
+        self.catalog = catalog
+        self.product_id = product_id
+
+    def update_price(self, new_price: float) -> None:
+        """Update the product price in the catalog."""
+        self.catalog.update_price(self.product_id, new_price)
+        print(f"Ціну товару «{self.catalog.names[self.product_id]}» змінено на {new_price:.2f}")
+
+    def remove(self) -> None:
+        """Remove the product from the catalog."""
+        self.catalog.remove(self.product_id)
+
+    def view_product(self) -> None:
+        """Print current product info."""
+        catalog, i = self.catalog, self.product_id
+        print(
+            f"Товар: {catalog.names[i]}, "
+            f"ціна: {catalog.prices[i]:.2f}, "
+            f"кількість: {catalog.quantities[i]}"
+        )
+
+
+# Catalog used by create_product() when none is given
+catalog = ProductCatalog()
+
+
+def create_product(name: str, price: float, quantity: int,
+                   store: Optional[ProductCatalog] = None) -> Tuple[
     Callable[[float], None], Callable[[], None]
 ]:
     """
     Create a product with name, price and quantity.
     Returns two functions: update_price and view_product.
+
+    The product is added to a ProductCatalog (the global `catalog` if
+    store is None); the functions are bound methods of a ProductView,
+    so they only remember the catalog and the product id. The product
+    stays in the catalog after the functions are gone: remove it with
+    catalog.remove(id) (or update_price.__self__.remove()), or pass a
+    store of your own for short-lived products.
+    """
+    store = catalog if store is None else store
+    product = ProductView(store, store.add(name, price, quantity))
+    return product.update_price, product.view_product
+
+
+def create_product_closure(name: str, price: float, quantity: int) -> Tuple[
+    Callable[[float], None], Callable[[], None]
+]:
+    """
+    Original closure version, kept for comparison.
     Demonstrates closures and use of 'nonlocal'.
     """
     current_price = price  # Enclosing scope
@@ -31,9 +263,65 @@ def create_product(name: str, price: float, quantity: int) -> Tuple[
     return update_price, view_product
 
 
-# Example usage
-update_price, view_product = create_product("Ноутбук", 25000.0, 5)
+# ------------------------- Benchmark -------------------------
+
+def benchmark_catalog(products: int = 200_000, queries: int = 1_000) -> None:
+    """
+    Memory per product (closures vs catalog) and price-range query time
+    (index vs a linear scan over the price column).
+    """
+    names = [f"product-{i}" for i in range(products)]  # shared by both variants
+    prices = [float((i * 7919) % 100_000) / 100 for i in range(products)]
+    quantities = [i % 50 for i in range(products)]
+
+    def build_closures() -> list:
+        return [create_product_closure(*row) for row in zip(names, prices, quantities)]
+
+    def build_catalog() -> ProductCatalog:
+        store = ProductCatalog()
+        store.add_many(zip(names, prices, quantities))
+        return store
+
+    for label, build in (("closures", build_closures), ("ProductCatalog", build_catalog)):
+        tracemalloc.start()
+        result = build()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<15} {size / 2**20:7.1f} MiB ({size / products:.1f} bytes per product)")
+        del result
+
+    store = build_catalog()
+    bounds = [(i % 900, i % 900 + 5.0) for i in range(queries)]
+    begin = time.perf_counter()
+    indexed = [len(store.price_range(lo, hi)) for lo, hi in bounds]
+    index_time = time.perf_counter() - begin
+    begin = time.perf_counter()
+    scanned = [sum(lo <= p <= hi for p in store.prices) for lo, hi in bounds[:20]]
+    scan_time = (time.perf_counter() - begin) * queries / 20
+    assert indexed[:20] == scanned
+    print(f"{queries} price-range queries: index {index_time:.4f} s, "
+          f"linear scan ~{scan_time:.2f} s (extrapolated)")
+
+    ids = range(0, products, 3)
+    begin = time.perf_counter()
+    store.update_prices(ids, [store.prices[i] * 0.9 for i in ids])
+    print(f"update_prices on {len(ids)} products: {time.perf_counter() - begin:.3f} s; "
+          f"stock value {store.stock_value():.2f}")
+
+
+if __name__ == "__main__":
+    # Example usage
+    update_price, view_product = create_product("Ноутбук", 25000.0, 5)
+
+    view_product()        # shows initial product
+    update_price(23000.0) # updates price
+    view_product()        # shows updated product
+
+    create_product("Миша", 800.0, 40)
+    create_product("Монітор", 9000.0, 7)
+    cheap = catalog.price_range(0, 10000)
+    print("До 10000:", [catalog.names[i] for i in cheap])
+    print(f"Вартість складу: {catalog.stock_value():.2f}")
 
-view_product()        # shows initial product
-update_price(23000.0) # updates price
-view_product()        # shows updated product
+    if "--bench" in sys.argv[1:]:
+        benchmark_catalog()
@@ -1,8 +1,29 @@
 # Task 4: Training session timer
 
+import asyncio
+import sys
+import time
+from typing import Any, Callable, Dict, List, Optional
+
 # Global scope variable lives in the module namespace
 default_time: int = 60
 
+# Minutes taken off every round after the first
+round_adjustment: int = 5
+
+
+def round_duration(round_num: int) -> int:
+    """
+    Closed-form duration of a round, equal to what training_session() prints.
+
+    Args:
+        round_num (int): Round number starting from 1.
+
+    Returns:
+        int: Duration in minutes.
+    """
+    return default_time - round_adjustment * (round_num - 1)
+
 
 def training_session(rounds: int) -> None:
     """
@@ -35,11 +56,269 @@ def training_session(rounds: int) -> None:
     # Built-in scope functions like print(), range() are always available
     for round_num in range(1, rounds + 1):
         if round_num > 1:
-            adjust_time(5)  # decrease 5 minutes per round after the first
+            adjust_time(round_adjustment)  # decrease 5 minutes per round after the first
             print(f"Раунд {round_num}: {time_per_round} хвилин (після коригування часу)")
         else:
             print(f"Раунд {round_num}: {time_per_round} хвилин")
 
 
-# Example usage
-training_session(3)
+# ------------------------- Timer wheel scheduler -------------------------
+
+class TimerWheel:
+    """
+    Hierarchical timing wheel working in integer ticks.
+
+    Level 0 has one slot per tick for the next 64 ticks, level 1 one slot
+    per 64 ticks, and so on. A timer is stored in the coarsest level that
+    still resolves its delay and moves down a level each time the finer
+    wheel wraps around, so add, cancel and advancing one tick are O(1)
+    amortized, independent of the number of timers.
+
+    A callback that raises does not affect the other timers of its tick:
+    the exception is passed to on_error (by default kept in `errors`).
+    """
+
+    BITS = 6
+    SLOTS = 1 << BITS
+    MASK = SLOTS - 1
+
+    def __init__(
+        self, levels: int = 4, on_error: Optional[Callable[[Exception], Any]] = None
+    ) -> None:
+        self.now: int = 0
+        self.levels = levels
+        self.wheels: List[List[list]] = [[[] for _ in range(self.SLOTS)] for _ in range(levels)]
+        self.overflow: List[list] = []
+        self.pending: int = 0
+        self.errors: List[Exception] = []
+        self.on_error = on_error if on_error is not None else self.errors.append
+
+    def schedule(self, delay: int, callback: Callable[..., Any], *args: Any) -> list:
+        """
+        Call callback(*args) after `delay` ticks (at least one tick).
+
+        Returns:
+            list: Timer handle for cancel().
+        """
+        timer = [self.now + max(delay, 1), callback, args]
+        self._insert(timer)
+        self.pending += 1
+        return timer
+
+    def cancel(self, timer: list) -> None:
+        """Cancel a scheduled timer (it is dropped lazily)."""
+        if timer[1] is not None:
+            timer[1] = None
+            self.pending -= 1
+
+    def _insert(self, timer: list) -> None:
+        when = timer[0]
+        delta = when - self.now
+        bits = self.BITS
+        for level in range(self.levels):
+            if delta < 1 << (bits * (level + 1)):
+                self.wheels[level][(when >> (bits * level)) & self.MASK].append(timer)
+                return
+        self.overflow.append(timer)
+
+    def tick(self) -> int:
+        """
+        Advance by one tick and run the timers that expire.
+
+        Returns:
+            int: Number of callbacks run.
+        """
+        self.now += 1
+        now = self.now
+        bits = self.BITS
+        # Cascade coarser wheels whose finer wheel just wrapped around
+        for level in range(1, self.levels):
+            if now & ((1 << (bits * level)) - 1):
+                break
+            slot = self.wheels[level][(now >> (bits * level)) & self.MASK]
+            self.wheels[level][(now >> (bits * level)) & self.MASK] = []
+            for timer in slot:
+                self._insert(timer)
+        else:
+            if self.overflow and not now & ((1 << (bits * self.levels)) - 1):
+                waiting, self.overflow = self.overflow, []
+                for timer in waiting:
+                    self._insert(timer)
+
+        slot = self.wheels[0][now & self.MASK]
+        if not slot:
+            return 0
+        self.wheels[0][now & self.MASK] = []
+        fired = 0
+        for index, timer in enumerate(slot):
+            callback = timer[1]
+            if callback is None:
+                continue
+            timer[1] = None
+            self.pending -= 1
+            fired += 1
+            try:
+                callback(*timer[2])
+            except Exception as error:
+                self.on_error(error)
+            except BaseException:
+                # KeyboardInterrupt and the like: the unprocessed timers
+                # run on the next tick instead of being lost
+                following = (now + 1) & self.MASK
+                self.wheels[0][following] = slot[index + 1:] + self.wheels[0][following]
+                raise
+        return fired
+
+    def advance(self, ticks: int) -> int:
+        """Advance by `ticks` ticks. Returns the number of callbacks run."""
+        fired = 0
+        for _ in range(ticks):
+            fired += self.tick()
+        return fired
+
+
+RoundCallback = Callable[[int, int, int], None]
+
+
+class TrainingScheduler:
+    """
+    Runs many training sessions concurrently on one TimerWheel.
+
+    Each round is a single timer: when it expires, on_round(session_id,
+    round_num, minutes) is called and the next round is scheduled using
+    round_duration(). One asyncio task drives the wheel, so the cost per
+    tick does not depend on the number of active sessions. Exceptions
+    raised by on_round are collected in wheel.errors; the session goes on.
+    """
+
+    def __init__(self, tick: float = 1.0, ticks_per_minute: int = 60) -> None:
+        """
+        Args:
+            tick (float): Seconds of real time per wheel tick.
+            ticks_per_minute (int): Wheel ticks in one training minute.
+        """
+        self.tick = tick
+        self.ticks_per_minute = ticks_per_minute
+        self.wheel = TimerWheel()
+        self.active: Dict[int, int] = {}  # session_id -> rounds left
+        self._next_id = 0
+        self._idle = asyncio.Event()
+        self._idle.set()
+
+    def add_session(self, rounds: int, on_round: RoundCallback) -> int:
+        """
+        Start a session; on_round is called when each round finishes.
+
+        Raises:
+            ValueError: If the number of rounds is less than 1.
+        """
+        if rounds < 1:
+            raise ValueError("Кількість раундів має бути не менше 1.")
+        session_id = self._next_id
+        self._next_id += 1
+        self.active[session_id] = rounds
+        self._idle.clear()
+        self._schedule_round(session_id, 1, on_round)
+        return session_id
+
+    def cancel_session(self, session_id: int) -> None:
+        """Stop a session; its remaining rounds are not run."""
+        self.active.pop(session_id, None)
+        if not self.active:
+            self._idle.set()
+
+    def _schedule_round(self, session_id: int, round_num: int, on_round: RoundCallback) -> None:
+        minutes = round_duration(round_num)
+        self.wheel.schedule(
+            minutes * self.ticks_per_minute,
+            self._finish_round, session_id, round_num, minutes, on_round,
+        )
+
+    def _finish_round(
+        self, session_id: int, round_num: int, minutes: int, on_round: RoundCallback
+    ) -> None:
+        rounds = self.active.get(session_id)
+        if rounds is None:
+            return  # cancelled
+        try:
+            on_round(session_id, round_num, minutes)
+        finally:
+            # A failing callback still moves the session on (the error is
+            # recorded by the wheel), so run() cannot wait on it forever
+            if round_num < rounds:
+                self._schedule_round(session_id, round_num + 1, on_round)
+            else:
+                self.cancel_session(session_id)
+
+    async def run(self) -> None:
+        """Drive the wheel in real time until every session has finished."""
+        loop = asyncio.get_running_loop()
+        next_tick = loop.time()
+        while self.active:
+            next_tick += self.tick
+            await asyncio.sleep(max(0.0, next_tick - loop.time()))
+            self.wheel.tick()
+
+    async def wait_idle(self) -> None:
+        """Wait until no session is active."""
+        await self._idle.wait()
+
+
+# ------------------------- Benchmark -------------------------
+
+def benchmark_scheduler(sizes: tuple = (10_000, 100_000), rounds: int = 3) -> None:
+    """
+    Measure scheduling overhead per round timer at several session counts.
+
+    The wheel is advanced in virtual time (no sleeping), so the numbers are
+    the pure cost of scheduling and firing the timers.
+    """
+    for count in sizes:
+        scheduler = TrainingScheduler(ticks_per_minute=60)
+        finished = 0
+
+        def on_round(session_id: int, round_num: int, minutes: int) -> None:
+            nonlocal finished
+            finished += 1
+
+        start = time.perf_counter()
+        for i in range(count):
+            scheduler.add_session(rounds, on_round)
+            if i % 100 == 0:
+                scheduler.wheel.tick()  # sessions start at different moments
+        add_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ticks = 0
+        while scheduler.active:
+            scheduler.wheel.tick()
+            ticks += 1
+        run_time = time.perf_counter() - start
+
+        assert finished == count * rounds
+        print(
+            f"{count:>7} sessions: add {add_time / count * 1e6:.2f} µs/session, "
+            f"{ticks} ticks in {run_time:.2f} s, "
+            f"{run_time / finished * 1e6:.2f} µs per round incl. empty ticks"
+        )
+
+
+async def _demo_scheduler() -> None:
+    scheduler = TrainingScheduler(tick=0.001, ticks_per_minute=1)
+
+    def on_round(session_id: int, round_num: int, minutes: int) -> None:
+        print(f"Сесія {session_id}, раунд {round_num}: {minutes} хвилин")
+
+    scheduler.add_session(3, on_round)
+    scheduler.add_session(2, on_round)
+    await scheduler.run()
+
+
+if __name__ == "__main__":
+    # Example usage
+    training_session(3)
+
+    asyncio.run(_demo_scheduler())
+
+    if "--bench" in sys.argv[1:]:
+        benchmark_scheduler()
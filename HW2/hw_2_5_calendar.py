@@ -1,37 +1,709 @@
-def calendar():
+import heapq
+import random
+import re
+import sys
+import time
+from bisect import bisect_left, insort
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# Date at the end of an event text, optionally with a time range:
+# "Воркшоп 20.09.25", "Воркшоп 20.09.2025" or "Воркшоп 20.09.25 10:00-12:30"
+_DATE_RE = re.compile(
+    r"(\d{1,2})\.(\d{1,2})\.(\d{2}|\d{4})"
+    r"(?:\s+(\d{1,2}):(\d{2})\s*-\s*(\d{1,2}):(\d{2}))?\s*$"
+)
+
+# Sort key for events whose text has no date: after every dated event
+UNDATED = datetime.max
+
+# How far view_events() looks ahead without an end date if a series never ends
+VIEW_HORIZON = timedelta(days=365)
+
+
+def parse_event_date(event: str) -> Optional[datetime]:
+    """
+    Parse the date at the end of an event text.
+
+    Args:
+        event (str): Event text, e.g. "Воркшоп 20.09.25".
+
+    Returns:
+        datetime | None: Midnight of that date, or None if there is no valid date.
+    """
+    period = parse_event_period(event)
+    return period[0] if period is not None else None
+
+
+def parse_event_period(event: str) -> Optional[Tuple[datetime, datetime]]:
+    """
+    Parse the date and optional time range at the end of an event text.
+
+    Args:
+        event (str): Event text, e.g. "Воркшоп 20.09.25 10:00-12:30".
+
+    Returns:
+        tuple[datetime, datetime] | None: Start and end of the event; an
+        event without a time range lasts the whole day. None if there is
+        no valid date.
+    """
+    match = _DATE_RE.search(event)
+    if match is None:
+        return None
+    day, month, year = (int(part) for part in match.groups()[:3])
+    if year < 100:
+        year += 2000
+    try:
+        day_start = datetime(year, month, day)
+        if match.group(4) is None:
+            return day_start, day_start + timedelta(days=1)
+        h1, m1, h2, m2 = (int(part) for part in match.groups()[3:])
+        start = day_start.replace(hour=h1, minute=m1)
+        end = day_start.replace(hour=h2, minute=m2)
+    except ValueError:
+        return None
+    if end <= start:
+        end += timedelta(days=1)  # e.g. 22:00-02:00 ends the next day
+    return start, end
+
+
+def _with_date(event: str, when: datetime) -> str:
+    """Return the event text with its trailing date replaced by `when`."""
+    return _DATE_RE.sub(
+        lambda m: when.strftime("%d.%m.%y") + m.string[m.end(3):m.end()], event, count=1
+    )
+
+
+def _add_months(when: datetime, months: int) -> Optional[datetime]:
+    """Return `when` moved by `months`, or None if that day does not exist."""
+    month0 = when.month - 1 + months
+    try:
+        return when.replace(year=when.year + month0 // 12, month=month0 % 12 + 1)
+    except ValueError:
+        return None  # e.g. the 31st in a 30-day month: no occurrence
+
+
+# Recurrence frequencies and their fixed step (monthly steps are computed)
+FREQUENCIES: Dict[str, Optional[timedelta]] = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+    "monthly": None,
+}
+
+# Reference point for the phase of fixed-period series (a Monday)
+_EPOCH = datetime(2000, 1, 3)
+
+
+def _month_index(when: datetime) -> int:
+    """Number of months since year 0, used for monthly phases."""
+    return when.year * 12 + when.month - 1
+
+
+def _time_of_day(when: datetime) -> timedelta:
+    return when - when.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class RecurringSeries:
+    """
+    Recurring event described by a rule, never materialized as a list.
+
+    Occurrences are start + n * interval * freq for n = 0, 1, ... limited by
+    `until` (inclusive) and `count`. occurrences() jumps straight to the
+    first n inside the query window, so the cost is proportional to the
+    number of occurrences in the window, not to the age of the series.
+    Cancelled occurrences are kept in the small `exdates` set.
+    """
+
+    __slots__ = ("event", "start", "freq", "interval", "until", "count", "exdates")
+
+    def __init__(
+        self,
+        event: str,
+        start: datetime,
+        freq: str,
+        interval: int = 1,
+        until: Optional[datetime] = None,
+        count: Optional[int] = None,
+    ) -> None:
+        if freq not in FREQUENCIES:
+            raise ValueError(f"Непідтримувана періодичність: {freq}")
+        if interval < 1 or (count is not None and count < 1):
+            raise ValueError("interval і count мають бути не менше 1")
+        self.event = event
+        self.start = start
+        self.freq = freq
+        self.interval = interval
+        self.until = until
+        self.count = count
+        self.exdates: Set[datetime] = set()
+
+    def group(self) -> Tuple[str, object]:
+        """Series with equal groups repeat with the same period."""
+        step = FREQUENCIES[self.freq]
+        if step is None:
+            return "monthly", self.interval
+        return "fixed", step * self.interval
+
+    def phase(self) -> tuple:
+        """Position of the occurrences inside one period of the group."""
+        step = FREQUENCIES[self.freq]
+        if step is None:
+            month = _month_index(self.start) % self.interval
+            return month, self.start.day, _time_of_day(self.start)
+        return ((self.start - _EPOCH) % (step * self.interval),)
+
+    def is_occurrence(self, when: datetime) -> bool:
+        """
+        Check a time that is in phase with the series against its limits.
+
+        Returns:
+            bool: True if `when` is not before the start, not after `until`,
+            within `count` and not cancelled.
+        """
+        if when < self.start or (self.until is not None and when > self.until):
+            return False
+        if self.count is not None:
+            step = FREQUENCIES[self.freq]
+            if step is None:
+                n = (_month_index(when) - _month_index(self.start)) // self.interval
+            else:
+                n = (when - self.start) // (step * self.interval)
+            if n >= self.count:
+                return False
+        return when not in self.exdates
+
+    def _nth(self, n: int) -> Optional[datetime]:
+        step = FREQUENCIES[self.freq]
+        if step is None:
+            return _add_months(self.start, n * self.interval)
+        return self.start + step * (n * self.interval)
+
+    def _first_index(self, start: datetime) -> int:
+        """Smallest n whose occurrence may be >= start (never skips one)."""
+        if start <= self.start:
+            return 0
+        step = FREQUENCIES[self.freq]
+        if step is None:
+            months = (start.year - self.start.year) * 12 + start.month - self.start.month
+            return max(0, months // self.interval - 1)
+        return (start - self.start) // (step * self.interval)
+
+    def occurrences(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[datetime]:
+        """
+        Lazily yield occurrence times with start <= time < end.
+
+        Args:
+            start (datetime | None): Inclusive lower bound, None for no bound.
+            end (datetime | None): Exclusive upper bound, None for no bound.
+        """
+        n = self._first_index(start) if start is not None else 0
+        while self.count is None or n < self.count:
+            when = self._nth(n)
+            n += 1
+            if when is None:
+                continue
+            if (end is not None and when >= end) or (self.until is not None and when > self.until):
+                return
+            if (start is None or when >= start) and when not in self.exdates:
+                yield when
+
+
+class _Node:
+    """
+    Treap node: one event keyed by (start, seq).
+
+    max_end is the latest end in the node's subtree, which makes the treap
+    an interval tree: a subtree with max_end <= t has no event after t.
+    """
+
+    __slots__ = ("key", "end", "max_end", "event", "priority", "left", "right")
+
+    def __init__(self, key: Tuple[datetime, int], end: datetime, event: str) -> None:
+        self.key = key
+        self.end = end
+        self.max_end = end
+        self.event = event
+        self.priority = random.random()
+        self.left: Optional["_Node"] = None
+        self.right: Optional["_Node"] = None
+
+    def update(self) -> "_Node":
+        """Recompute max_end from the children."""
+        max_end = self.end
+        if self.left is not None and self.left.max_end > max_end:
+            max_end = self.left.max_end
+        if self.right is not None and self.right.max_end > max_end:
+            max_end = self.right.max_end
+        self.max_end = max_end
+        return self
+
+
+def _split(
+    node: Optional[_Node], key: Tuple[datetime, int]
+) -> Tuple[Optional[_Node], Optional[_Node]]:
+    """Split a treap into keys < key and keys >= key."""
+    if node is None:
+        return None, None
+    if node.key < key:
+        node.right, right = _split(node.right, key)
+        return node.update(), right
+    left, node.left = _split(node.left, key)
+    return left, node.update()
+
+
+def _merge(left: Optional[_Node], right: Optional[_Node]) -> Optional[_Node]:
+    """Merge two treaps where every key of left is below every key of right."""
+    if left is None:
+        return right
+    if right is None:
+        return left
+    if left.priority > right.priority:
+        left.right = _merge(left.right, right)
+        return left.update()
+    right.left = _merge(left, right.left)
+    return right.update()
+
+
+class EventStore:
+    """
+    Events kept in a treap ordered by their date.
+
+    Insert and remove are O(log n) expected, a range query costs
+    O(log n + k) for k results and iteration is lazy. Removing by text
+    uses a dict from event text to its keys, so no linear search is needed.
+    """
+
+    def __init__(self) -> None:
+        self._root: Optional[_Node] = None
+        self._by_text: Dict[str, List[Tuple[datetime, int]]] = {}
+        self._seq = 0
+        self._size = 0
+        # Recurring series by id, and (phase..., id) sorted per period group
+        self.series: Dict[int, RecurringSeries] = {}
+        self._series_groups: Dict[Tuple[str, object], List[tuple]] = {}
+        self._series_by_text: Dict[str, List[int]] = {}
+
+    def __len__(self) -> int:
+        """Number of single events (recurring series are counted separately)."""
+        return self._size
+
+    def __contains__(self, event: object) -> bool:
+        return event in self._by_text or event in self._series_by_text
+
+    def __iter__(self) -> Iterator[Tuple[datetime, str]]:
+        return self.between()
+
+    def has_unbounded_series(self) -> bool:
+        """True if some series repeats forever (no `until`, no `count`)."""
+        return any(s.until is None and s.count is None for s in self.series.values())
+
+    def add(
+        self,
+        event: str,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Tuple[datetime, int]:
+        """
+        Add an event.
+
+        Args:
+            event (str): Event text.
+            start (datetime | None): Event start; parsed from the text if None.
+            end (datetime | None): Event end (exclusive); parsed from the text
+                if None, or equal to start when start is given.
+
+        Returns:
+            tuple[datetime, int]: Key of the stored event.
+        """
+        start, end = self._period(event, start, end)
+        key = (start, self._seq)
+        self._seq += 1
+        left, right = _split(self._root, key)
+        self._root = _merge(_merge(left, _Node(key, end, event)), right)
+        self._by_text.setdefault(event, []).append(key)
+        self._size += 1
+        return key
+
+    @staticmethod
+    def _period(
+        event: str,
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> Tuple[datetime, datetime]:
+        """Start and end of an event from the arguments or the event text."""
+        if start is None:
+            start, parsed_end = parse_event_period(event) or (UNDATED, UNDATED)
+            end = parsed_end if end is None else end
+        elif end is None:
+            end = start
+        if end < start:
+            raise ValueError(f"Подія «{event}» закінчується раніше, ніж починається")
+        return start, end
+
+    def conflicts(self, start: datetime, end: datetime) -> List[Tuple[datetime, datetime, str]]:
+        """
+        Single events that overlap [start, end), in start order.
+
+        Intervals are half-open; events without duration never conflict.
+        The search skips every subtree whose max_end is not after start and
+        every right subtree once node starts reach end: O(log n + k).
+
+        Returns:
+            list[tuple[datetime, datetime, str]]: (start, end, event) of each conflict.
+        """
+        found: List[Tuple[datetime, datetime, str]] = []
+        if end <= start:
+            return found
+        stack: List[_Node] = [self._root] if self._root is not None else []
+        while stack:
+            node = stack.pop()
+            if node.max_end <= start:
+                continue  # nothing in this subtree ends after start
+            node_start = node.key[0]
+            if node_start < end:
+                if node.right is not None:
+                    stack.append(node.right)
+                if node.end > start and node.end > node_start:
+                    found.append((node_start, node.end, node.event))
+            if node.left is not None:
+                stack.append(node.left)
+        found.sort()
+        return found
+
+    def overlapping_pairs(self) -> List[Tuple[str, str]]:
+        """
+        All pairs of single events that overlap, found with a sweep line.
+
+        Events are visited in start order (in-order walk of the treap);
+        a heap keeps the events still running, ordered by end.
+        O(n log n + k) for k pairs.
+
+        Returns:
+            list[tuple[str, str]]: (earlier event, later event) pairs.
+        """
+        pairs: List[Tuple[str, str]] = []
+        active: List[Tuple[datetime, int, str]] = []
+        stack: List[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                stack.append(node)
+                node = node.left
+                continue
+            node = stack.pop()
+            start = node.key[0]
+            while active and active[0][0] <= start:
+                heapq.heappop(active)
+            if node.end > start:
+                pairs.extend((event, node.event) for _, _, event in active)
+                heapq.heappush(active, (node.end, node.key[1], node.event))
+            node = node.right
+        return pairs
+
+    def remove(self, event: str) -> bool:
+        """
+        Remove the earliest added event with this text.
+
+        Returns:
+            bool: False if there is no such event.
+        """
+        keys = self._by_text.get(event)
+        if not keys:
+            return False
+        key = keys.pop(0)
+        if not keys:
+            del self._by_text[event]
+        left, rest = _split(self._root, key)
+        _, right = _split(rest, (key[0], key[1] + 1))
+        self._root = _merge(left, right)
+        self._size -= 1
+        return True
+
+    def add_series(
+        self,
+        event: str,
+        freq: str,
+        start: Optional[datetime] = None,
+        interval: int = 1,
+        until: Optional[datetime] = None,
+        count: Optional[int] = None,
+    ) -> int:
+        """
+        Add a recurring event ("daily", "weekly" or "monthly").
+
+        Args:
+            event (str): Event text; its date is the first occurrence if start is None.
+            freq (str): Recurrence frequency.
+            start (datetime | None): First occurrence.
+            interval (int): Repeat every `interval` periods.
+            until (datetime | None): Last possible occurrence (inclusive).
+            count (int | None): Maximal number of occurrences.
+
+        Returns:
+            int: Series id.
+
+        Raises:
+            ValueError: If there is no start date or the rule is invalid.
+        """
+        if start is None:
+            start = parse_event_date(event)
+            if start is None:
+                raise ValueError(f"Не вказано дату початку для «{event}»")
+        series_id = self._seq
+        self._seq += 1
+        self.series[series_id] = RecurringSeries(event, start, freq, interval, until, count)
+        series = self.series[series_id]
+        insort(self._series_groups.setdefault(series.group(), []), (*series.phase(), series_id))
+        self._series_by_text.setdefault(event, []).append(series_id)
+        return series_id
+
+    def remove_series(self, series_id: int) -> bool:
+        """Remove a whole series. Returns False if there is no such series."""
+        series = self.series.pop(series_id, None)
+        if series is None:
+            return False
+        entries = self._series_groups[series.group()]
+        entries.pop(bisect_left(entries, (*series.phase(), series_id)))
+        ids = self._series_by_text[series.event]
+        ids.remove(series_id)
+        if not ids:
+            del self._series_by_text[series.event]
+        return True
+
+    def cancel_occurrence(self, series_id: int, when: datetime) -> None:
+        """Cancel one occurrence of a series (the rest stays)."""
+        self.series[series_id].exdates.add(when)
+
+    def end_series(self, series_id: int, last: datetime) -> None:
+        """Cancel every occurrence of a series after `last`."""
+        series = self.series[series_id]
+        if series.until is None or last < series.until:
+            series.until = last
+
+    def _occurrences(
+        self,
+        series_id: int,
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> Iterator[Tuple[datetime, str]]:
+        series = self.series[series_id]
+        for when in series.occurrences(start, end):
+            yield when, _with_date(series.event, when)
+
+    def _fixed_window(
+        self,
+        period: timedelta,
+        entries: List[tuple],
+        start: datetime,
+        end: datetime,
+    ) -> Iterator[Tuple[datetime, int]]:
+        """(time, series id) for a window shorter than the period."""
+        low = (start - _EPOCH) % period
+        high = low + (end - start)
+        ranges = [(low, high)] if high <= period else [(low, period), (timedelta(0), high - period)]
+        base = start - low
+        for shift, (a, b) in enumerate(ranges):
+            first = bisect_left(entries, (a, -1))
+            last = bisect_left(entries, (b, -1))
+            for phase, series_id in entries[first:last]:
+                yield base + period * shift + phase, series_id
+
+    def _monthly_window(
+        self,
+        interval: int,
+        entries: List[tuple],
+        start: datetime,
+        end: datetime,
+    ) -> Iterator[Tuple[datetime, int]]:
+        """(time, series id) for a window of at most `interval` months."""
+        first_month, last_month = _month_index(start), _month_index(end)
+        zero = timedelta(0)
+        for month in range(first_month, last_month + 1):
+            mod = month % interval
+            if month == first_month:
+                low = (mod, start.day, _time_of_day(start), -1)
+            else:
+                low = (mod, 1, zero, -1)
+            if month == last_month:
+                high = (mod, end.day, _time_of_day(end), -1)
+            else:
+                high = (mod, 32, zero, -1)
+            year, month0 = divmod(month, 12)
+            in_month = entries[bisect_left(entries, low):bisect_left(entries, high)]
+            for _, day, tod, series_id in in_month:
+                try:
+                    yield datetime(year, month0 + 1, day) + tod, series_id
+                except ValueError:
+                    continue  # no such day in this month
+
+    def between(
+        self,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[Tuple[datetime, str]]:
+        """
+        Lazily yield (date, event) with start <= date < end, in date order.
+
+        Occurrences of recurring series are generated for the window only.
+        Series are grouped by period and sorted by phase inside the period,
+        so a window shorter than the period finds its occurrences with a
+        binary search instead of visiting every series; longer windows fall
+        back to one lazy generator per series.
+
+        Args:
+            start (datetime | None): Inclusive lower bound, None for no bound.
+            end (datetime | None): Exclusive upper bound, None for no bound.
+
+        Raises:
+            ValueError: If end is None while a series repeats forever
+                (its expansion would never stop).
+        """
+        if not self.series:
+            return self._single_between(start, end)
+        if end is None and self.has_unbounded_series():
+            raise ValueError("Для нескінченних повторюваних подій потрібна кінцева дата")
+
+        sources = [self._single_between(start, end)]
+        found: List[Tuple[datetime, str]] = []
+        for (kind, period), entries in self._series_groups.items():
+            hits: Optional[Iterator[Tuple[datetime, int]]] = None
+            if start is not None and end is not None:
+                if kind == "fixed" and end - start < period:
+                    hits = self._fixed_window(period, entries, start, end)
+                elif kind == "monthly" and _month_index(end) - _month_index(start) <= 12:
+                    hits = self._monthly_window(period, entries, start, end)
+            if hits is None:
+                sources.extend(self._occurrences(entry[-1], start, end) for entry in entries)
+                continue
+            for when, series_id in hits:
+                series = self.series[series_id]
+                if start <= when < end and series.is_occurrence(when):
+                    found.append((when, _with_date(series.event, when)))
+        if found:
+            found.sort()
+            sources.append(iter(found))
+        return heapq.merge(*sources)
+
+    def _single_between(
+        self,
+        start: Optional[datetime],
+        end: Optional[datetime],
+    ) -> Iterator[Tuple[datetime, str]]:
+        """In-order walk of the treap limited to [start, end)."""
+        low = (start, -1) if start is not None else None
+        stack: List[_Node] = []
+        node = self._root
+        while stack or node is not None:
+            if node is not None:
+                if low is not None and node.key < low:
+                    node = node.right  # whole left subtree is below start
+                else:
+                    stack.append(node)
+                    node = node.left
+                continue
+            node = stack.pop()
+            if end is not None and node.key[0] >= end:
+                return
+            yield node.key[0], node.event
+            node = node.right
+
+    def pages(
+        self,
+        page_size: int,
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+    ) -> Iterator[List[Tuple[datetime, str]]]:
+        """
+        Lazily yield the events of between(start, end) in pages of page_size.
+
+        Raises:
+            ValueError: If page_size is less than 1.
+        """
+        if page_size < 1:
+            raise ValueError("Розмір сторінки має бути не менше 1")
+        page: List[Tuple[datetime, str]] = []
+        for item in self.between(start, end):
+            page.append(item)
+            if len(page) == page_size:
+                yield page
+                page = []
+        if page:
+            yield page
+
+
+def calendar(store: Optional[EventStore] = None) -> Tuple[
+    Callable[[str], None],
+    Callable[[str], None],
+    Callable[..., None],
+]:
     """
     Closure that provides functions for:
     - adding events
     - removing events
-    - viewing events
-    Events are stored in an enclosing scope variable (not global).
-    Demonstrates the use of 'nonlocal'.
+    - viewing events (optionally only those between two dates)
+    Events are stored in an enclosing scope EventStore (not global),
+    indexed by the date at the end of the event text.
+
+    Args:
+        store (EventStore | None): Existing store to wrap, e.g. to run
+            range queries on it directly; a new one is created if None.
     """
-    events: list[str] = []  # Enclosing scope
+    events: EventStore = store if store is not None else EventStore()  # Enclosing scope
+
+    def add_event(
+        event: str,
+        repeat: Optional[str] = None,
+        until: Optional[date] = None,
+        count: Optional[int] = None,
+    ) -> None:
+        """
+        Add event to the enclosing store.
 
-    def add_event(event: str) -> None:
-        """Add event to the enclosing list using nonlocal."""
-        nonlocal events
-        events.append(event)
+        With repeat="daily", "weekly" or "monthly" the event recurs from its
+        date, optionally until a date (inclusive) or for `count` times.
+        """
+        if repeat is None:
+            start, end = events._period(event, None, None)
+            for _, _, other in events.conflicts(start, end):
+                print(f"Увага: «{event}» перетинається з «{other}»")
+            events.add(event, start, end)
+        else:
+            last = datetime.combine(until, datetime.max.time()) if until else None
+            events.add_series(event, repeat, until=last, count=count)
         print(f"Подію «{event}» додано")
 
     def remove_event(event: str) -> None:
-        """Remove event from the enclosing list using nonlocal."""
-        nonlocal events
-        if event in events:
-            events.remove(event)
+        """Remove event (or the recurring series with this text) from the store."""
+        series_ids = events._series_by_text.get(event)
+        if events.remove(event) or (series_ids and events.remove_series(series_ids[0])):
             print(f"Подію «{event}» видалено")
         else:
             print(f"Подію «{event}» не знайдено")
 
-    def view_events() -> None:
-        """View all upcoming events."""
-        if not events:
+    def view_events(start: Optional[date] = None, end: Optional[date] = None) -> None:
+        """
+        View upcoming events in date order, optionally in [start, end).
+
+        Without `end`, series that repeat forever are shown only up to
+        VIEW_HORIZON after `start` (or today).
+        """
+        low = datetime.combine(start, datetime.min.time()) if start else None
+        high = datetime.combine(end, datetime.min.time()) if end else None
+        if high is None and events.has_unbounded_series():
+            high = datetime.combine(start or date.today(), datetime.min.time()) + VIEW_HORIZON
+            print(f"(повторювані події показано до {high:%d.%m.%Y})")
+        found = False
+        for _, e in events.between(low, high):
+            if not found:
+                print("Майбутні події:")
+                found = True
+            print(f" • {e}")
+        if not found:
             print("Майбутніх подій не знайдено")
-        else:
-            print("Майбутні події:")
-            for e in events:
-                print(f" • {e}")
 
     return add_event, remove_event, view_events
 
@@ -41,7 +713,122 @@ add_event, remove_event, view_events = calendar()
 
 add_event("Воркшоп 20.09.25")
 add_event("Тестування 24.09.25")
+add_event("Реліз 01.10.25")
 view_events()
+view_events(date(2025, 9, 21), date(2025, 10, 1))
 
 remove_event("Тестування 24.09.25")
 view_events()
+
+add_event("Дзвінок 20.09.25 10:00-11:00")
+add_event("Йога 16.09.25", repeat="weekly", count=10)
+view_events(date(2025, 9, 20), date(2025, 10, 8))
+
+
+# ------------------------- Benchmark -------------------------
+
+def benchmark_recurring(series_count: int = 100_000, queries: int = 20) -> None:
+    """
+    Time one-day window queries over many recurring series.
+
+    Args:
+        series_count (int): Number of weekly/monthly series.
+        queries (int): Number of window queries.
+    """
+    store = EventStore()
+    base = datetime(2020, 1, 1)
+    for i in range(series_count):
+        start = base + timedelta(days=i % 365, hours=i % 24)
+        store.add_series(f"Серія {i}", "weekly" if i % 2 else "monthly", start)
+
+    found = 0
+    begin = time.perf_counter()
+    for q in range(queries):
+        low = base + timedelta(days=400 + q)
+        found += sum(1 for _ in store.between(low, low + timedelta(days=1)))
+    elapsed = time.perf_counter() - begin
+    print(
+        f"{series_count} series, {queries} one-day windows: "
+        f"{elapsed / queries * 1000:.1f} ms per query, {found / queries:.0f} occurrences per query"
+    )
+
+
+def _random_periods(n: int, rng: random.Random) -> List[Tuple[datetime, datetime]]:
+    """n random (start, end) periods during 2025, some of them zero-length."""
+    base = datetime(2025, 1, 1)
+    lengths = [0, 15, 30, 60, 240, 1440]
+    result = []
+    for _ in range(n):
+        start = base + timedelta(minutes=rng.randrange(0, 60 * 24 * 365))
+        result.append((start, start + timedelta(minutes=rng.choice(lengths))))
+    return result
+
+
+def check_conflicts(count: int = 2_000, queries: int = 200, seed: int = 5) -> None:
+    """
+    Compare conflicts() and overlapping_pairs() with a brute-force answer.
+
+    Raises:
+        AssertionError: If the interval tree or the sweep line disagree
+            with the brute force (raised explicitly, so it also works under -O).
+    """
+    rng = random.Random(seed)
+    periods = _random_periods(count, rng)
+    store = EventStore()
+    for i, (start, end) in enumerate(periods):
+        store.add(f"e{i}", start, end)
+
+    def overlap(a: Tuple[datetime, datetime], b: Tuple[datetime, datetime]) -> bool:
+        return a[0] < a[1] and b[0] < b[1] and a[0] < b[1] and b[0] < a[1]
+
+    for start, end in _random_periods(queries, rng):
+        expected = {f"e{i}" for i, p in enumerate(periods) if overlap(p, (start, end))}
+        found = {e for _, _, e in store.conflicts(start, end)}
+        if found != expected:
+            raise AssertionError(f"conflicts({start}, {end}): {found ^ expected}")
+    expected_pairs = {
+        frozenset((f"e{i}", f"e{j}"))
+        for i in range(count) for j in range(i + 1, count)
+        if overlap(periods[i], periods[j])
+    }
+    pairs = store.overlapping_pairs()
+    if len(pairs) != len(expected_pairs) or {frozenset(p) for p in pairs} != expected_pairs:
+        raise AssertionError("overlapping_pairs() differs from brute force")
+    print(f"Conflicts check: {queries} queries and {len(pairs)} pairs match brute force")
+
+
+def benchmark_conflicts(count: int = 100_000) -> None:
+    """
+    Time conflict queries and the overlapping-pairs sweep.
+
+    Args:
+        count (int): Number of events in the timed store.
+    """
+    rng = random.Random()
+    store = EventStore()
+    begin = time.perf_counter()
+    for i, (start, end) in enumerate(_random_periods(count, rng)):
+        store.add(f"e{i}", start, end)
+    add_time = time.perf_counter() - begin
+
+    queries = _random_periods(1_000, rng)
+    begin = time.perf_counter()
+    found = sum(len(store.conflicts(start, end)) for start, end in queries)
+    query_time = time.perf_counter() - begin
+
+    begin = time.perf_counter()
+    pairs = store.overlapping_pairs()
+    sweep_time = time.perf_counter() - begin
+    print(
+        f"{count} events: add {add_time / count * 1e6:.1f} µs/event, "
+        f"conflicts {query_time / len(queries) * 1e6:.0f} µs/query "
+        f"({found / len(queries):.1f} hits), "
+        f"all {len(pairs)} overlapping pairs in {sweep_time:.2f} s"
+    )
+
+
+if "--check" in sys.argv[1:] or "--bench" in sys.argv[1:]:
+    check_conflicts()
+if "--bench" in sys.argv[1:]:
+    benchmark_recurring()
+    benchmark_conflicts()
@@ -1,4 +1,8 @@
-from typing import Callable
+import operator as op
+import sys
+import time
+from array import array
+from typing import Callable, Dict, Sequence, Tuple
 
 
 def safe_div(a: float, b: float) -> float:
@@ -20,6 +24,15 @@ def safe_div(a: float, b: float) -> float:
     return a / b
 
 
+# Precompiled operator table, built once at import time
+OPERATIONS: Dict[str, Callable[[float, float], float]] = {
+    '+': op.add,
+    '-': op.sub,
+    '*': op.mul,
+    '/': safe_div,  # окрема функція для ділення
+}
+
+
 def create_calculator(operator: str) -> Callable[[float, float], float]:
     """
     Create a calculator function for the given operator.
@@ -33,20 +46,85 @@ def create_calculator(operator: str) -> Callable[[float, float], float]:
     Raises:
         ValueError: If operator is not supported.
     """
-    operations = {
-        '+': lambda a, b: a + b,
-        '-': lambda a, b: a - b,
-        '*': lambda a, b: a * b,
-        '/': safe_div,  # окрема функція для ділення
-    }
+    if operator not in OPERATIONS:
+        raise ValueError(f"Непідтримуваний оператор: {operator}")
+
+    # The operator function itself: no extra lookup or call per calculation
+    return OPERATIONS[operator]
+
+
+def calculate_many(
+    operator: str,
+    a_seq: Sequence[float],
+    b_seq: Sequence[float],
+) -> Tuple[array, bytearray]:
+    """
+    Apply an operator element-wise to two sequences in one pass.
 
-    if operator not in operations:
+    Division by zero does not stop the batch: the result is NaN and the
+    element is marked in the error mask.
+
+    Args:
+        operator (str): One of '+', '-', '*', '/'.
+        a_seq (Sequence[float]): Left operands (list, array('d'), ...).
+        b_seq (Sequence[float]): Right operands, same length as a_seq.
+
+    Returns:
+        tuple[array, bytearray]: Results as array('d') and an error mask
+        (1 where the division was by zero, 0 otherwise).
+
+    Raises:
+        ValueError: If operator is not supported or the lengths differ.
+    """
+    if operator not in OPERATIONS:
         raise ValueError(f"Непідтримуваний оператор: {operator}")
+    if len(a_seq) != len(b_seq):
+        raise ValueError("Послідовності мають бути однакової довжини")
+
+    errors = bytearray(len(a_seq))
+    if operator != '/':
+        return array("d", map(OPERATIONS[operator], a_seq, b_seq)), errors
 
-    def calculate(a: float, b: float) -> float:
-        return operations[operator](a, b)
+    if 0 not in b_seq:
+        return array("d", map(op.truediv, a_seq, b_seq)), errors
+    nan = float("nan")
+    results = array("d", [a / b if b else nan for a, b in zip(a_seq, b_seq)])
+    for i, b in enumerate(b_seq):
+        if not b:
+            errors[i] = 1
+    return results, errors
 
-    return calculate
+
+# ------------------------- Benchmark -------------------------
+
+def benchmark_calculator(count: int = 1_000_000) -> None:
+    """
+    Compare per-call overhead of the old closure, the returned operator
+    function and calculate_many().
+
+    Args:
+        count (int): Number of operand pairs.
+    """
+    a_seq = array("d", (float(i) for i in range(count)))
+    b_seq = array("d", (float(i % 97 + 1) for i in range(count)))
+
+    operations = {'+': lambda a, b: a + b}
+
+    def calculate(a: float, b: float) -> float:  # the previous implementation
+        return operations['+'](a, b)
+
+    plus = create_calculator('+')
+    variants = [
+        ("closure + dict + lambda", lambda: [calculate(a, b) for a, b in zip(a_seq, b_seq)]),
+        ("create_calculator('+')", lambda: [plus(a, b) for a, b in zip(a_seq, b_seq)]),
+        ("calculate_many('+')", lambda: calculate_many('+', a_seq, b_seq)),
+        ("calculate_many('/')", lambda: calculate_many('/', a_seq, b_seq)),
+    ]
+    for label, run in variants:
+        start = time.perf_counter()
+        run()
+        elapsed = time.perf_counter() - start
+        print(f"{label:<26} {elapsed:.3f} s ({elapsed / count * 1e9:.0f} ns per operation)")
 
 
 # Example usage
@@ -59,3 +137,9 @@ print(add(10, 5))   # 15
 print(sub(10, 5))   # 5
 print(mul(10, 5))   # 50
 print(div(10, 5))   # 2.0
+
+results, errors = calculate_many('/', [10, 1, 7], [5, 0, 2])
+print(list(results), list(errors))   # [2.0, nan, 3.5] [0, 1, 0]
+
+if "--bench" in sys.argv[1:]:
+    benchmark_calculator()
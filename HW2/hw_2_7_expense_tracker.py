@@ -1,38 +1,475 @@
-# Global variable to store total expenses
-total_expense: float = 0.0
+import csv
+import itertools
+import os
+import sys
+import tempfile
+import threading
+import time
+import weakref
+from array import array
+from bisect import bisect_left
+from datetime import date, timedelta
+from decimal import ROUND_HALF_UP, Decimal, InvalidOperation
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+
+class _ThreadToken:
+    """Kept in one thread's threading.local; freed when that thread ends."""
+
+    __slots__ = ("__weakref__",)
+
+
+class ShardedAccumulator:
+    """
+    Integer total that many threads can add to without contending.
+
+    Every thread adds to its own cell (found through threading.local), so
+    writers never share a counter or take a lock; the lock is only taken
+    once per thread to register its cell. total() merges the cells on read.
+    Each cell holds an exact int, so the merged total is exact.
+
+    When a thread ends, its cell is folded into a base value and removed,
+    so short-lived threads do not make the cell list (and total()) grow.
+    """
+
+    def __init__(self) -> None:
+        self._local = threading.local()
+        self._cells: Dict[int, List[int]] = {}
+        self._base = 0  # sums of the threads that have ended
+        self._ids = itertools.count()
+        self._register_lock = threading.Lock()
+
+    def _cell(self) -> List[int]:
+        cell = [0]
+        key = next(self._ids)
+        with self._register_lock:
+            self._cells[key] = cell
+        token = _ThreadToken()
+        weakref.finalize(token, ShardedAccumulator._fold, weakref.ref(self), key)
+        self._local.cell = cell
+        self._local.token = token
+        return cell
+
+    @staticmethod
+    def _fold(accumulator_ref: "weakref.ref[ShardedAccumulator]", key: int) -> None:
+        """Move the cell of an ended thread into the base value."""
+        accumulator = accumulator_ref()
+        if accumulator is not None:
+            with accumulator._register_lock:
+                accumulator._base += accumulator._cells.pop(key)[0]
+
+    def add(self, value: int) -> None:
+        """Add value to the calling thread's partial sum."""
+        try:
+            cell = self._local.cell
+        except AttributeError:
+            cell = self._cell()
+        cell[0] += value
+
+    def total(self) -> int:
+        """Sum of all partial sums."""
+        with self._register_lock:
+            base, cells = self._base, list(self._cells.values())
+        # A cell folded after the snapshot is in `cells` but not in `base`
+        return base + sum(cell[0] for cell in cells)
+
+
+class LockedAccumulator:
+    """Integer total behind one global lock (baseline for the benchmark)."""
+
+    def __init__(self) -> None:
+        self._value = 0
+        self._lock = threading.Lock()
+
+    def add(self, value: int) -> None:
+        with self._lock:
+            self._value += value
+
+    def total(self) -> int:
+        return self._value
+
+
+# Global variable to store total expenses (in cents, one partial sum per thread)
+total_expense: ShardedAccumulator = ShardedAccumulator()
+
+
+# Journal that add_expense() also records into (see open_expense_ledger)
+expense_ledger: Optional["ExpenseLedger"] = None
+_ledger_lock = threading.Lock()
 
 
 def add_expense(amount: float) -> None:
     """
     Add an expense to the global total_expense.
-    Demonstrates use of the 'global' keyword.
+    The global name is only read, so no 'global' statement is needed:
+    the sharded accumulator is safe to update from many threads at once.
+    When a ledger is open, the expense is journaled first (under a lock).
     """
-    global total_expense
-    total_expense += amount
-    print(f"Додано витрату: {amount:.2f}. Поточна сума: {total_expense:.2f}")
+    if expense_ledger is None:
+        cents = to_cents(amount)
+    else:
+        with _ledger_lock:
+            cents = expense_ledger.add(amount)
+    total_expense.add(cents)
+    print(f"Додано витрату: {amount:.2f}. Поточна сума: {get_expense():.2f}")
 
 
 def get_expense() -> float:
     """
     Return the current total expenses.
     """
-    return total_expense
+    return total_expense.total() / 100
+
+
+# ------------------------- Ledger -------------------------
 
+Amount = Union[str, int, float, Decimal]
 
-# Simple console interface (no main function)
-print("Трекер витрат")
-print("Введіть число для додавання витрат або 'exit' для виходу")
+# Journal of the console tracker, in the current directory
+JOURNAL_PATH = "expenses.journal"
 
-while True:
-    user_input = input("Введіть витрату: ")
 
-    if user_input.lower() == "exit":
-        print(f"Загальна сума витрат: {get_expense():.2f}")
-        print("Програма завершена.")
-        break
+def _drop_torn_tail(path: str) -> None:
+    """
+    Cut the ledger journal back to its last full "YYYY-MM-DD,cents" line.
+
+    An entry whose write was interrupted has no "\n"; without this, the
+    next add() would be glued onto it (e.g. "2025-01-02025-01-02,500").
+    """
+    with open(path, "rb+") as file:
+        end = file.seek(0, os.SEEK_END)
+        position = end
+        while position > 0:
+            step = min(4096, position)
+            file.seek(position - step)
+            newline = file.read(step).rfind(b"\n")
+            if newline >= 0:
+                position = position - step + newline + 1
+                break
+            position -= step
+        if position != end:
+            file.truncate(position)
 
+
+def to_cents(amount: Amount) -> int:
+    """
+    Convert an amount of money to integer cents (ROUND_HALF_UP).
+
+    Raises:
+        ValueError: If the amount is not a number.
+    """
     try:
-        amount = float(user_input)
-        add_expense(amount)
-    except ValueError:
-        print("Помилка: введіть число або 'exit'")
+        value = Decimal(str(amount).strip())
+    except InvalidOperation:
+        raise ValueError(f"Некоректна сума: {amount!r}") from None
+    if not value.is_finite():
+        raise ValueError(f"Некоректна сума: {amount!r}")
+    return int((value * 100).quantize(Decimal(1), rounding=ROUND_HALF_UP))
+
+
+class ExpenseLedger:
+    """
+    Expense ledger in integer cents with an optional append-only journal.
+
+    Journal lines are "YYYY-MM-DD,cents". The running total is updated on
+    every add, so total_cents is O(1). Per-day totals are kept as sorted
+    day numbers with prefix sums, so the sum over any date range (a day,
+    a month, years) is two binary searches, without rescanning the journal.
+    """
+
+    def __init__(self, path: Optional[str] = None) -> None:
+        """
+        Args:
+            path (str | None): Journal file; existing entries are loaded and
+                new ones appended. None keeps the ledger in memory only.
+        """
+        self.path = path
+        self.total_cents: int = 0
+        self.count: int = 0
+        self._days = array("q")      # sorted day ordinals that have expenses
+        self._prefix = array("q", [0])  # _prefix[i] = sum of the first i days
+        self._journal = None
+        if path is not None:
+            if os.path.exists(path):
+                with open(path, "r", encoding="utf-8", newline="") as file:
+                    self._apply(self._parse_journal(file))
+                _drop_torn_tail(path)
+            self._journal = open(path, "a", encoding="utf-8", newline="")
+
+    @staticmethod
+    def _parse_journal(lines: Iterable[str]) -> Iterable[Tuple[int, int]]:
+        for line in lines:
+            if line.endswith("\n"):  # a torn last line is skipped
+                day, cents = line.split(",")
+                yield date.fromisoformat(day).toordinal(), int(cents)
+
+    def _apply(self, entries: Iterable[Tuple[int, int]]) -> List[Tuple[int, int]]:
+        """
+        Add (day ordinal, cents) entries to the totals and index.
+
+        Entries on or after the newest day extend the prefix sums in O(1).
+        Back-dated ones are summed per day and merged once at the end, so
+        a batch in any order (bank exports often list the newest first)
+        costs O(days + entries) instead of O(days) per entry.
+        """
+        applied = []
+        late: Dict[int, int] = {}  # back-dated day -> cents
+        days, prefix = self._days, self._prefix
+        for day, cents in entries:
+            applied.append((day, cents))
+            self.total_cents += cents
+            self.count += 1
+            if days and day == days[-1]:
+                prefix[-1] += cents  # the common case: today again
+            elif not days or day > days[-1]:
+                days.append(day)
+                prefix.append(prefix[-1] + cents)
+            else:
+                late[day] = late.get(day, 0) + cents
+        if late:
+            self._merge_days(late)
+        return applied
+
+    def _merge_days(self, late: Dict[int, int]) -> None:
+        """Merge per-day sums into the index and rebuild the prefix sums."""
+        days, prefix = self._days, self._prefix
+        totals = {day: prefix[i + 1] - prefix[i] for i, day in enumerate(days)}
+        for day, cents in late.items():
+            totals[day] = totals.get(day, 0) + cents
+        merged = sorted(totals)  # already sorted runs: close to linear
+        self._days = array("q", merged)
+        self._prefix = array("q", [0])
+        self._prefix.extend(itertools.accumulate(map(totals.__getitem__, merged)))
+
+    def _write(self, entries: List[Tuple[int, int]]) -> None:
+        if self._journal is not None and entries:
+            self._journal.writelines(
+                f"{date.fromordinal(day).isoformat()},{cents}\n" for day, cents in entries
+            )
+            self._journal.flush()
+
+    def add(self, amount: Amount, day: Optional[date] = None) -> int:
+        """
+        Record one expense.
+
+        Args:
+            amount (str | int | float | Decimal): Amount in currency units.
+            day (date | None): Date of the expense, today if None.
+
+        Returns:
+            int: The amount in cents.
+        """
+        cents = to_cents(amount)
+        day = day or date.today()
+        self._write(self._apply([(day.toordinal(), cents)]))
+        return cents
+
+    def import_csv(
+        self,
+        path: str,
+        date_column: str = "date",
+        amount_column: str = "amount",
+        batch_size: int = 10_000,
+    ) -> int:
+        """
+        Stream a CSV file of expenses into the ledger.
+
+        The file is read row by row and journaled in batches, so memory use
+        does not depend on the file size.
+
+        Returns:
+            int: Number of imported rows.
+
+        Raises:
+            ValueError: If a row has an invalid date or amount (rows before
+                it stay imported).
+        """
+        imported = 0
+        with open(path, "r", encoding="utf-8", newline="") as file:
+            batch: List[Tuple[int, int]] = []
+            for line_no, row in enumerate(csv.DictReader(file), start=2):
+                try:
+                    day = date.fromisoformat(row[date_column].strip()).toordinal()
+                    batch.append((day, to_cents(row[amount_column])))
+                except (KeyError, ValueError, AttributeError) as error:
+                    self._write(self._apply(batch))
+                    raise ValueError(f"{path}:{line_no}: {error}") from None
+                if len(batch) >= batch_size:
+                    self._write(self._apply(batch))
+                    imported += len(batch)
+                    batch = []
+            self._write(self._apply(batch))
+            imported += len(batch)
+        return imported
+
+    def total_between(self, start: date, end: date) -> int:
+        """Sum in cents of expenses with start <= day < end (O(log n))."""
+        lo = bisect_left(self._days, start.toordinal())
+        hi = bisect_left(self._days, end.toordinal())
+        return self._prefix[hi] - self._prefix[lo]
+
+    def day_total(self, day: date) -> int:
+        """Sum in cents for one day."""
+        return self.total_between(day, day + timedelta(days=1))
+
+    def month_total(self, year: int, month: int) -> int:
+        """Sum in cents for one calendar month."""
+        start = date(year, month, 1)
+        end = date(year + month // 12, month % 12 + 1, 1)
+        return self.total_between(start, end)
+
+    def rolling(self, end: date, days: int) -> int:
+        """Sum in cents over the `days` days that end with `end` (inclusive)."""
+        last = end + timedelta(days=1)
+        return self.total_between(last - timedelta(days=days), last)
+
+    def close(self) -> None:
+        """Close the journal file."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+
+def open_expense_ledger(path: str = JOURNAL_PATH) -> ExpenseLedger:
+    """
+    Back the tracker with a journal file.
+
+    Expenses already in the journal are added to total_expense, and every
+    later add_expense() call is appended to it, so the total survives a
+    restart.
+    """
+    global expense_ledger
+    ledger = ExpenseLedger(path)
+    total_expense.add(ledger.total_cents)
+    expense_ledger = ledger
+    return ledger
+
+
+# ------------------------- Benchmark -------------------------
+
+def benchmark_ledger(years: int = 10, per_day: int = 100) -> None:
+    """
+    Import a generated CSV and time range queries against a journal rescan.
+
+    Args:
+        years (int): Years of history in the generated file.
+        per_day (int): Expenses per day.
+    """
+    first = date(2015, 1, 1)
+    days = 365 * years
+    with tempfile.TemporaryDirectory() as directory:
+        csv_path = os.path.join(directory, "expenses.csv")
+        with open(csv_path, "w", encoding="utf-8", newline="") as file:
+            file.write("date,amount\n")
+            for d in range(days):
+                day = (first + timedelta(days=d)).isoformat()
+                file.writelines(f"{day},{(d * 37 + i) % 5000 / 100:.2f}\n" for i in range(per_day))
+
+        ledger = ExpenseLedger(os.path.join(directory, "ledger.journal"))
+        start = time.perf_counter()
+        rows = ledger.import_csv(csv_path)
+        import_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        for m in range(12 * years):
+            ledger.month_total(first.year + m // 12, m % 12 + 1)
+        query_time = (time.perf_counter() - start) / (12 * years)
+
+        target = first.replace(year=first.year + years // 2)
+        month_end = target.replace(month=target.month % 12 + 1)
+        start = time.perf_counter()
+        with open(ledger.path, "r", encoding="utf-8") as file:
+            rescan = sum(
+                cents for day, cents in ExpenseLedger._parse_journal(file)
+                if target.toordinal() <= day < month_end.toordinal()
+            )
+        rescan_time = time.perf_counter() - start
+        assert rescan == ledger.month_total(target.year, target.month)
+        ledger.close()
+
+    print(f"Imported {rows} rows in {import_time:.2f} s")
+    print(f"month_total: {query_time * 1e6:.1f} µs per query")
+    print(f"Journal rescan for one month: {rescan_time:.2f} s")
+
+
+def _run_threads(
+    accumulator: Union[ShardedAccumulator, LockedAccumulator],
+    threads: int,
+    per_thread: int,
+) -> float:
+    """Add 1..per_thread from every thread; return the elapsed seconds."""
+    def work() -> None:
+        add = accumulator.add
+        for i in range(1, per_thread + 1):
+            add(i)
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    start = time.perf_counter()
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+    return time.perf_counter() - start
+
+
+def stress_accumulator(threads: int = 16, per_thread: int = 200_000) -> None:
+    """
+    Add from many threads at once while another thread keeps reading,
+    then check that the total is exact.
+    """
+    accumulator = ShardedAccumulator()
+    done = threading.Event()
+    reads = 0
+
+    def reader() -> None:
+        nonlocal reads
+        while not done.is_set():
+            accumulator.total()
+            reads += 1
+
+    watcher = threading.Thread(target=reader)
+    watcher.start()
+    _run_threads(accumulator, threads, per_thread)
+    done.set()
+    watcher.join()
+    expected = threads * per_thread * (per_thread + 1) // 2
+    assert accumulator.total() == expected, (accumulator.total(), expected)
+    print(f"Stress test passed: {threads} threads, {reads} concurrent reads, total {expected}")
+
+
+def benchmark_accumulators(threads: int = 8, per_thread: int = 500_000) -> None:
+    """Compare throughput of the sharded and the single-lock accumulator."""
+    for accumulator in (LockedAccumulator(), ShardedAccumulator()):
+        elapsed = _run_threads(accumulator, threads, per_thread)
+        print(
+            f"{type(accumulator).__name__:<20} {threads * per_thread / elapsed / 1e6:.2f} M adds/s"
+        )
+
+
+if __name__ == "__main__":
+    if "--bench" in sys.argv[1:]:
+        benchmark_ledger()
+        stress_accumulator()
+        benchmark_accumulators()
+        sys.exit()
+
+    # Simple console interface (no main function)
+    ledger = open_expense_ledger()
+    print("Трекер витрат")
+    print("Введіть число для додавання витрат або 'exit' для виходу")
+    print(f"Збережена сума витрат: {get_expense():.2f}")
+
+    while True:
+        user_input = input("Введіть витрату: ")
+
+        if user_input.lower() == "exit":
+            print(f"Загальна сума витрат: {get_expense():.2f}")
+            print("Програма завершена.")
+            ledger.close()
+            break
+
+        try:
+            amount = float(user_input)
+            add_expense(amount)
+        except ValueError:
+            print("Помилка: введіть число або 'exit'")
@@ -1,57 +1,261 @@
-from typing import Any, Callable, Tuple
+import itertools
+import sys
+import threading
+import tracemalloc
+import weakref
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Any, Callable, Dict, Hashable, Iterable, Iterator, List, Mapping, Optional, Tuple
 
+# Shared, read-only defaults layer for every user
+DEFAULT_SETTINGS: Mapping[str, Any] = MappingProxyType({
+    "theme": "light",
+    "language": "en",
+    "notifications": True,
+})
 
-def create_user_settings() -> Tuple[
+
+def _not_found(key: str) -> str:
+    """Message returned by get_setting() for an unknown key."""
+    return f"Налаштування «{key}» не знайдено"
+
+
+class SettingsStore:
+    """
+    Layered settings for many users.
+
+    One immutable defaults layer is shared by everybody; each user only has
+    a dict of the keys they changed, and only once they changed something.
+    Setting a value equal to the default (same type and value, so 1 does
+    not count as True) drops the override again, so memory grows with the
+    number of changes, not users x keys.
+    """
+
+    def __init__(self, defaults: Mapping[str, Any] = DEFAULT_SETTINGS) -> None:
+        self.defaults: Mapping[str, Any] = MappingProxyType(dict(defaults))
+        self._overrides: Dict[Hashable, Dict[str, Any]] = {}
+
+    def get(self, user_id: Hashable, key: str) -> Any:
+        """Return the user's value for key, or the not-found message."""
+        overrides = self._overrides.get(user_id)
+        if overrides is not None and key in overrides:
+            return overrides[key]
+        return self.defaults.get(key, _not_found(key))
+
+    def get_many(self, user_ids: Iterable[Hashable], key: str) -> List[Any]:
+        """Return the value of key for every user in user_ids, in order."""
+        default = self.defaults.get(key, _not_found(key))
+        overrides = self._overrides
+        empty: Dict[str, Any] = {}
+        return [overrides.get(user_id, empty).get(key, default) for user_id in user_ids]
+
+    def _is_default(self, key: str, value: Any) -> bool:
+        """True if value is the default of key, of the same type."""
+        if key not in self.defaults:
+            return False
+        default = self.defaults[key]
+        return type(default) is type(value) and default == value
+
+    def set(self, user_id: Hashable, key: str, value: Any) -> None:
+        """Set a value for one user (stored only if it differs from the default)."""
+        if self._is_default(key, value):
+            overrides = self._overrides.get(user_id)
+            if overrides is not None:
+                overrides.pop(key, None)
+                if not overrides:
+                    del self._overrides[user_id]
+            return
+        self._overrides.setdefault(user_id, {})[key] = value
+
+    def view(self, user_id: Hashable) -> Dict[str, Any]:
+        """Return a merged copy of the user's settings."""
+        return {**self.defaults, **self._overrides.get(user_id, {})}
+
+    def drop(self, user_id: Hashable) -> None:
+        """Forget all overrides of a user."""
+        self._overrides.pop(user_id, None)
+
+    def __len__(self) -> int:
+        """Number of users with at least one override."""
+        return len(self._overrides)
+
+
+class SettingsSnapshot(dict):
+    """
+    Published overrides of one user, with the version they were published at.
+
+    A snapshot is never changed after publishing; writers build a new one.
+    """
+
+    __slots__ = ("version",)
+
+    def __init__(self, values: Mapping[str, Any], version: int) -> None:
+        super().__init__(values)
+        self.version = version
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> None:
+        raise TypeError("SettingsSnapshot is read-only")
+
+    __setitem__ = __delitem__ = update = pop = popitem = clear = setdefault = _readonly
+
+
+# Snapshot of a user without overrides
+_EMPTY_SNAPSHOT = SettingsSnapshot({}, 0)
+
+
+class SnapshotSettingsStore(SettingsStore):
+    """
+    SettingsStore for read-mostly use from many threads.
+
+    Writers never modify published overrides: they copy the user's snapshot,
+    apply a whole batch of changes and publish the result with one dict item
+    assignment, which is an atomic reference swap. Readers take no lock and
+    always see either the old or the new snapshot, never a partial update.
+    Writers are serialized by a lock; versions increase store-wide, so a
+    changed version always means changed settings.
+    """
+
+    def __init__(self, defaults: Mapping[str, Any] = DEFAULT_SETTINGS) -> None:
+        super().__init__(defaults)
+        self._overrides: Dict[Hashable, SettingsSnapshot] = {}
+        self._write_lock = threading.Lock()
+        self._versions = itertools.count(1)
+
+    def set(self, user_id: Hashable, key: str, value: Any) -> None:
+        """Set one value (published as its own snapshot)."""
+        self.set_many(user_id, {key: value})
+
+    def set_many(self, user_id: Hashable, changes: Mapping[str, Any]) -> int:
+        """
+        Apply several changes as one snapshot.
+
+        Returns:
+            int: Version of the published snapshot.
+        """
+        with self._write_lock:
+            values = dict(self._overrides.get(user_id, _EMPTY_SNAPSHOT))
+            for key, value in changes.items():
+                if self._is_default(key, value):
+                    values.pop(key, None)
+                else:
+                    values[key] = value
+            snapshot = SettingsSnapshot(values, next(self._versions))
+            self._overrides[user_id] = snapshot  # atomic swap
+        return snapshot.version
+
+    @contextmanager
+    def batch(self, user_id: Hashable) -> Iterator[Dict[str, Any]]:
+        """
+        Collect changes in a dict and publish them as one snapshot on exit.
+
+        Example:
+            with store.batch(user) as changes:
+                changes["theme"] = "dark"
+                changes["language"] = "uk"
+        """
+        changes: Dict[str, Any] = {}
+        yield changes
+        if changes:
+            self.set_many(user_id, changes)
+
+    def drop(self, user_id: Hashable) -> None:
+        """Forget all overrides of a user."""
+        with self._write_lock:
+            self._overrides.pop(user_id, None)
+
+    def version(self, user_id: Hashable) -> int:
+        """Current version of a user's settings (0 if never changed)."""
+        return self._overrides.get(user_id, _EMPTY_SNAPSHOT).version
+
+    def view_versioned(self, user_id: Hashable) -> Tuple[int, Mapping[str, Any]]:
+        """
+        Return (version, merged read-only settings) from one snapshot.
+
+        A caller keeps the version and later compares it with version()
+        to find out cheaply whether its copy is stale.
+        """
+        snapshot = self._overrides.get(user_id, _EMPTY_SNAPSHOT)
+        return snapshot.version, MappingProxyType({**self.defaults, **snapshot})
+
+
+# Global store used by create_user_settings()
+settings_store = SettingsStore()
+_user_ids = itertools.count()
+
+
+class _AnonymousOwner:
+    """Held by the closures of an anonymous user; freed together with them."""
+
+    __slots__ = ("__weakref__",)
+
+
+def create_user_settings(
+    user_id: Optional[Hashable] = None,
+    store: Optional[SettingsStore] = None,
+) -> Tuple[
     Callable[[str, Any], None],
     Callable[[str], Any],
     Callable[[], None],
 ]:
     """
-    Demonstrates LEGB principle and the use of nonlocal via a closure.
+    Demonstrates LEGB principle via a closure.
 
     (Local): variables inside set_setting/get_setting/view_settings
-    (Enclosing): 'settings' defined in create_user_settings
-    (Global): the function create_user_settings itself, imported modules
+    (Enclosing): 'store' and 'user_id' defined in create_user_settings
+    (Global): settings_store, DEFAULT_SETTINGS, imported modules
     (Built-in): functions like print(), dict, str
 
+    Settings live in a SettingsStore: the closures share its defaults and
+    only the user's changes are stored.
+
+    Args:
+        user_id (Hashable | None): User the closures act for; a new anonymous
+            user if None. Nobody else can reach an anonymous user, so its
+            overrides are dropped from the store once the closures are gone.
+        store (SettingsStore | None): Store to use; settings_store if None.
+
     Returns:
         Tuple containing three functions:
             - set_setting(key: str, value: Any) -> None
             - get_setting(key: str) -> Any
             - view_settings() -> None
     """
-    # Enclosing scope variable
-    settings: dict[str, Any] = {
-        "theme": "light",
-        "language": "en",
-        "notifications": True,
-    }
+    # Enclosing scope variables
+    if store is None:
+        store = settings_store
+    owner = None
+    if user_id is None:
+        user_id = ("anonymous", next(_user_ids))
+        owner = _AnonymousOwner()
+        weakref.finalize(owner, store.drop, user_id)
 
     def set_setting(key: str, value: Any) -> None:
         """
         L = Local: key, value
-        E = settings (nonlocal)
+        E = store, user_id
         """
-        nonlocal settings
-        settings[key] = value
+        store.set(user_id, key, value)
         print(f"Налаштування «{key}» збережено: {value}")
 
     def get_setting(key: str) -> Any:
         """
         L = Local: key
-        E = settings
+        E = store, user_id
         """
-        return settings.get(key, f"Налаштування «{key}» не знайдено")
+        return store.get(user_id, key)
 
     def view_settings() -> None:
         """
         L = Local: k, v (loop vars)
-        E = settings
+        E = store, user_id
         """
         print("Поточні налаштування користувача:")
-        for k, v in settings.items():
+        for k, v in store.view(user_id).items():
             print(f" • {k}: {v}")
 
+    if owner is not None:
+        # Each function keeps the owner alive; the last one collected frees it
+        set_setting.owner = get_setting.owner = view_settings.owner = owner
     return set_setting, get_setting, view_settings
 
 
@@ -67,3 +271,76 @@ set_setting("notifications", False)
 
 view_settings()  # show updated
 print("Мова інтерфейсу:", get_setting("language"))
+print("Налаштування, якого немає:", get_setting("font"))
+
+
+# ------------------------- Benchmark -------------------------
+
+def benchmark_memory(users: int = 1_000_000, changed_every: int = 100) -> None:
+    """
+    Memory of per-user full copies vs SettingsStore at `users` users,
+    where every `changed_every`-th user changed one setting.
+    """
+    def build_copies() -> List[Dict[str, Any]]:
+        copies = []
+        for i in range(users):
+            settings = dict(DEFAULT_SETTINGS)
+            if i % changed_every == 0:
+                settings["theme"] = "dark"
+            copies.append(settings)
+        return copies
+
+    def build_store() -> SettingsStore:
+        store = SettingsStore()
+        for i in range(0, users, changed_every):
+            store.set(i, "theme", "dark")
+        return store
+
+    for label, build in (("Full copy per user", build_copies), ("SettingsStore", build_store)):
+        tracemalloc.start()
+        result = build()
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{label:<20} {size / 2**20:8.1f} MiB ({size / users:.1f} bytes per user)")
+        del result
+
+    store = build_store()
+    themes = store.get_many(range(users), "theme")
+    assert themes.count("dark") == -(-users // changed_every)
+
+
+def check_snapshot_reads(readers: int = 4, writes: int = 20_000) -> None:
+    """
+    One writer flips theme and language together while readers check that
+    they never see one changed without the other.
+    """
+    store = SnapshotSettingsStore()
+    pairs = [("light", "en"), ("dark", "uk")]
+    done = threading.Event()
+    torn = 0
+
+    def reader() -> None:
+        nonlocal torn
+        while not done.is_set():
+            _, settings = store.view_versioned("user")
+            if (settings["theme"], settings["language"]) not in pairs:
+                torn += 1
+
+    threads = [threading.Thread(target=reader) for _ in range(readers)]
+    for thread in threads:
+        thread.start()
+    for i in range(writes):
+        theme, language = pairs[i % 2]
+        with store.batch("user") as changes:
+            changes["theme"] = theme
+            changes["language"] = language
+    done.set()
+    for thread in threads:
+        thread.join()
+    assert torn == 0, f"{torn} partial updates seen"
+    print(f"Snapshot reads: {writes} batched writes, no partial updates seen")
+
+
+if "--bench" in sys.argv[1:]:
+    benchmark_memory()
+    check_snapshot_reads()
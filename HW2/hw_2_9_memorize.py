@@ -1,26 +1,1006 @@
-def memoize(func):
-    """Return a wrapper that caches results in an enclosing dict."""
-    cache = {}  # Enclosing scope
-
-    def wrapper(n):
-        if n in cache:
-            print("⏱️ Беремо з кеша")  # для наочності
-            return cache[n]
-        result = func(n)
-        cache[n] = result
+import hashlib
+import operator
+import os
+import pickle
+import sqlite3
+import struct
+import sys
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from functools import wraps
+from multiprocessing import Lock as ProcessLock, shared_memory
+from typing import (
+    Any, Callable, Dict, Hashable, Iterable, Iterator, List, NamedTuple, Optional, Tuple,
+)
+
+
+class _KwargsMark:
+    """
+    Marks the start of keyword arguments inside a cache key.
+
+    The class itself is the marker: it pickles by name, so keys read back
+    from the disk tier compare equal to newly built ones.
+    """
+
+
+def make_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """
+    Build a cache key from positional and keyword arguments.
+
+    f(1, b=2) and f(1, b=2) give equal keys; the keyword order does not
+    matter. A single positional argument is its own key (cheap common case).
+    """
+    if not kwargs:
+        return args[0] if len(args) == 1 and type(args[0]) in (int, str) else args
+    return args + (_KwargsMark,) + tuple(sorted(kwargs.items()))
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a memoized function."""
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    currsize: int
+    maxsize: Optional[int]
+    disk_hits: int = 0
+
+
+class _InFlight:
+    """Result of a call that one thread is computing and others wait for."""
+
+    __slots__ = ("done", "thread", "value", "error")
+
+    def __init__(self) -> None:
+        # A held plain lock, released when the result is ready: much cheaper
+        # to create than threading.Event on every miss
+        self.done = threading.Lock()
+        self.done.acquire()
+        self.thread = threading.get_ident()  # the thread computing the result
+        self.value: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class _Segment:
+    """One lock stripe: an LRU OrderedDict plus its counters."""
+
+    __slots__ = (
+        "lock", "entries", "inflight", "hits", "misses", "evictions", "expirations", "disk_hits",
+    )
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # key -> (value, expires_at or None); the end is the most recently used
+        self.entries: "OrderedDict[Hashable, Tuple[Any, Optional[float]]]" = OrderedDict()
+        self.inflight: Dict[Hashable, _InFlight] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.disk_hits = 0
+
+
+# ------------------------- Disk tier -------------------------
+
+class DiskTier:
+    """
+    Second cache tier in a local sqlite file, shared by restarts.
+
+    Rows are keyed by (function, version, pickled key): bump `version` when
+    the function's logic changes and old results are never returned again
+    (they are deleted when a store is opened with the new version).
+    When the stored payload exceeds max_bytes, the least recently used rows
+    are deleted until it is below 90% of the limit.
+    """
+
+    _SCHEMA = (
+        "CREATE TABLE IF NOT EXISTS memo ("
+        " func TEXT NOT NULL, version TEXT NOT NULL, key BLOB NOT NULL,"
+        " value BLOB NOT NULL, size INTEGER NOT NULL, used INTEGER NOT NULL,"
+        " PRIMARY KEY (func, version, key)) WITHOUT ROWID"
+    )
+
+    def __init__(self, path: str, func: str, version: str = "1",
+                 max_bytes: Optional[int] = 64 * 1024 * 1024) -> None:
+        self.path = path
+        self.func = func
+        self.version = version
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.execute(self._SCHEMA)
+        self._db.execute("CREATE INDEX IF NOT EXISTS memo_used ON memo (used)")
+        self._db.execute(
+            "DELETE FROM memo WHERE func = ? AND version <> ?", (func, version)
+        )
+        self._bytes, last_used = self._db.execute(
+            "SELECT COALESCE(SUM(size), 0), COALESCE(MAX(used), 0) FROM memo"
+        ).fetchone()
+        self._tick = last_used
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (found, value) and mark the row as recently used."""
+        try:
+            blob = pickle.dumps(key, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False, None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT value FROM memo WHERE func = ? AND version = ? AND key = ?",
+                (self.func, self.version, blob),
+            ).fetchone()
+            if row is None:
+                return False, None
+            self._tick += 1
+            self._db.execute(
+                "UPDATE memo SET used = ? WHERE func = ? AND version = ? AND key = ?",
+                (self._tick, self.func, self.version, blob),
+            )
+        try:
+            return True, pickle.loads(row[0])
+        except Exception:
+            # A stale row (e.g. a renamed class without a version bump):
+            # drop it and let the caller compute the value again
+            self._delete(blob)
+            return False, None
+
+    def _delete(self, blob: bytes) -> None:
+        """Delete the row of one pickled key."""
+        where = (self.func, self.version, blob)
+        with self._lock:
+            row = self._db.execute(
+                "SELECT size FROM memo WHERE func = ? AND version = ? AND key = ?", where
+            ).fetchone()
+            if row is not None:
+                self._db.execute(
+                    "DELETE FROM memo WHERE func = ? AND version = ? AND key = ?", where
+                )
+                self._bytes -= row[0]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Store a result; keys or values that cannot be pickled are skipped."""
+        try:
+            blob = pickle.dumps(key, pickle.HIGHEST_PROTOCOL)
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return
+        size = len(blob) + len(payload)
+        with self._lock:
+            old = self._db.execute(
+                "SELECT size FROM memo WHERE func = ? AND version = ? AND key = ?",
+                (self.func, self.version, blob),
+            ).fetchone()
+            self._tick += 1
+            self._db.execute(
+                "INSERT OR REPLACE INTO memo VALUES (?, ?, ?, ?, ?, ?)",
+                (self.func, self.version, blob, payload, size, self._tick),
+            )
+            self._bytes += size - (old[0] if old else 0)
+            if self.max_bytes is not None and self._bytes > self.max_bytes:
+                self._evict(self.max_bytes * 9 // 10)
+
+    def _evict(self, target: int) -> None:
+        """Delete least recently used rows until the payload fits `target`."""
+        rows = self._db.execute("SELECT used, size FROM memo ORDER BY used")
+        freed, cutoff = 0, None  # rows with used <= cutoff are deleted
+        for used, size in rows:
+            if self._bytes - freed <= target:
+                break
+            freed += size
+            cutoff = used
+        if cutoff is not None:
+            self._db.execute("DELETE FROM memo WHERE used <= ?", (cutoff,))
+            # Re-read the total: other stores may share the file
+            self._bytes = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM memo"
+            ).fetchone()[0]
+
+    def recent(self, limit: Optional[int]) -> Iterator[Tuple[Hashable, Any]]:
+        """
+        Yield up to `limit` entries of this function, most recent last.
+        Rows that no longer unpickle are deleted and skipped.
+        """
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT key, value FROM memo WHERE func = ? AND version = ?"
+                " ORDER BY used DESC LIMIT ?",
+                (self.func, self.version, -1 if limit is None else limit),
+            ).fetchall()
+        for key, value in reversed(rows):
+            try:
+                entry = pickle.loads(key), pickle.loads(value)
+            except Exception:
+                self._delete(key)
+                continue
+            yield entry
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._db.execute("SELECT COUNT(*) FROM memo").fetchone()[0]
+
+    @property
+    def nbytes(self) -> int:
+        """Pickled size of all stored keys and values."""
+        return self._bytes
+
+    def close(self) -> None:
+        """Close the sqlite connection."""
+        with self._lock:
+            self._db.close()
+
+
+def memoize(
+    func: Optional[Callable[..., Any]] = None,
+    *,
+    maxsize: Optional[int] = 1024,
+    ttl: Optional[float] = None,
+    stripes: int = 16,
+    disk: Optional[str] = None,
+    version: str = "1",
+    max_disk_bytes: Optional[int] = 64 * 1024 * 1024,
+    warm_start: bool = False,
+) -> Callable[..., Any]:
+    """
+    Return a wrapper that caches results in an enclosing store.
+
+    Can be used as @memoize or @memoize(maxsize=..., ttl=...).
+
+    - Keys are built from args and kwargs (see make_key).
+    - LRU eviction once maxsize entries are cached (None = unbounded) and
+      optional expiry `ttl` seconds after an entry was stored.
+    - The cache is split into `stripes` segments with their own lock and
+      LRU order, so threads working on different keys rarely contend.
+    - Single flight: concurrent misses for the same key compute it once,
+      the other callers wait for that result. A call that re-enters the
+      same key in the computing thread raises RecursionError.
+    - The hit path does no I/O; use wrapper.cache_info() for statistics.
+    - disk: optional sqlite file used as a second tier (see DiskTier) that
+      survives restarts; memory misses look there before calling func and
+      disk hits are promoted to memory. Change `version` when func's
+      results change. warm_start=True preloads the most recently used
+      disk entries (up to maxsize) into memory when decorating.
+      The ttl applies to the memory tier only.
+    """
+    if func is None:
+        return lambda f: memoize(
+            f, maxsize=maxsize, ttl=ttl, stripes=stripes, disk=disk,
+            version=version, max_disk_bytes=max_disk_bytes, warm_start=warm_start,
+        )
+    if stripes < 1:
+        raise ValueError("stripes must be >= 1")
+
+    segments: List[_Segment] = [_Segment() for _ in range(stripes)]  # Enclosing scope
+    segment_size = None if maxsize is None else max(1, -(-maxsize // stripes))
+    clock = time.monotonic
+    tier = None
+    if disk is not None:
+        tier = DiskTier(disk, f"{func.__module__}.{func.__qualname__}", version, max_disk_bytes)
+
+    def remember(segment: _Segment, key: Hashable, value: Any) -> None:
+        """Insert into a segment (caller holds its lock) and apply LRU."""
+        segment.entries[key] = (value, None if ttl is None else clock() + ttl)
+        if segment_size is not None and len(segment.entries) > segment_size:
+            segment.entries.popitem(last=False)
+            segment.evictions += 1
+
+    if tier is not None and warm_start:
+        for key, value in tier.recent(maxsize):
+            segment = segments[hash(key) % stripes]
+            with segment.lock:
+                remember(segment, key, value)
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = make_key(args, kwargs)
+        segment = segments[hash(key) % stripes]
+        with segment.lock:
+            entry = segment.entries.get(key)
+            if entry is not None:
+                if entry[1] is None or entry[1] > clock():
+                    segment.entries.move_to_end(key)
+                    segment.hits += 1
+                    return entry[0]
+                del segment.entries[key]
+                segment.expirations += 1
+            flight = segment.inflight.get(key)
+            owner = flight is None
+            if owner:
+                flight = segment.inflight[key] = _InFlight()
+                segment.misses += 1
+            elif flight.thread == threading.get_ident():
+                # func(key) calls itself with the same key: waiting for our
+                # own result would block forever
+                raise RecursionError(f"{func.__qualname__} called itself with the same arguments")
+            else:
+                segment.hits += 1
+
+        if not owner:
+            with flight.done:  # wait for the owner to release it
+                pass
+            if flight.error is not None:
+                raise flight.error
+            return flight.value
+
+        try:
+            found = False
+            if tier is not None:
+                found, result = tier.get(key)
+            if not found:
+                result = func(*args, **kwargs)
+                if tier is not None:
+                    tier.put(key, result)
+        except BaseException as error:
+            flight.error = error
+            with segment.lock:
+                del segment.inflight[key]
+            flight.done.release()
+            raise
+
+        with segment.lock:
+            remember(segment, key, result)
+            segment.disk_hits += found
+            del segment.inflight[key]
+        flight.value = result
+        flight.done.release()
         return result
 
+    def cache_info() -> CacheInfo:
+        """Return hit/miss/eviction statistics."""
+        return CacheInfo(
+            hits=sum(s.hits for s in segments),
+            misses=sum(s.misses for s in segments),
+            evictions=sum(s.evictions for s in segments),
+            expirations=sum(s.expirations for s in segments),
+            currsize=sum(len(s.entries) for s in segments),
+            maxsize=maxsize,
+            disk_hits=sum(s.disk_hits for s in segments),
+        )
+
+    def cache_clear() -> None:
+        """Remove every cached entry and reset the statistics."""
+        for s in segments:
+            with s.lock:
+                s.entries.clear()
+                s.hits = s.misses = s.evictions = s.expirations = s.disk_hits = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
+    wrapper.disk = tier
+    return wrapper
+
+
+# ------------------------- Stack-safe variant -------------------------
+
+class _Deferred(BaseException):
+    """
+    Raised by a too deep cache miss; the driver loop computes it first.
+
+    BaseException, so `except Exception` inside the user function does not
+    swallow it. `owner` is the memoize_deep wrapper the miss belongs to:
+    in mutual recursion only that wrapper's driver may retry it.
+    """
+
+    def __init__(
+        self, owner: Callable[..., Any], key: Hashable,
+        args: Tuple[Any, ...], kwargs: Dict[str, Any],
+    ) -> None:
+        super().__init__(key)
+        self.owner = owner
+        self.key = key
+        self.args_ = args
+        self.kwargs = kwargs
+
+
+def memoize_deep(
+    func: Optional[Callable[..., Any]] = None, *, depth_limit: int = 100,
+) -> Callable[..., Any]:
+    """
+    Stack-safe memoize for deeply recursive pure functions.
+
+    Works like @memoize on the same (unchanged) recursive function, but a
+    cold chain like f(10**6) -> f(10**6 - 1) -> ... does not overflow the
+    stack. Nested misses deeper than `depth_limit` are not entered: the
+    call is abandoned and its arguments are pushed on an explicit work
+    stack. The outermost call computes the stack top first, then retries
+    the abandoned calls, which now find their dependencies in the cache.
+    Each retry re-runs at most `depth_limit` levels, so the total work
+    stays linear in the chain length. Mutually recursive functions (each
+    with its own memoize_deep) work too: a deferred miss unwinds to the
+    driver of the function it belongs to.
+
+    The cache is unbounded: evicting a dependency of a pending call would
+    make the retries repeat work indefinitely.
+
+    Raises:
+        RecursionError: If a call depends on itself (a real cycle).
+    """
+    if func is None:
+        return lambda f: memoize_deep(f, depth_limit=depth_limit)
+    if depth_limit < 1:
+        raise ValueError("depth_limit must be >= 1")
+
+    cache: Dict[Hashable, Any] = {}  # Enclosing scope
+    stats = {"hits": 0, "misses": 0}
+    state = threading.local()  # recursion depth of the current thread
+
+    @wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        key = make_key(args, kwargs)
+        try:
+            result = cache[key]
+        except KeyError:
+            pass
+        else:
+            stats["hits"] += 1
+            return result
+
+        depth = getattr(state, "depth", 0)
+        if depth:
+            # Nested call: run it directly while the stack is shallow
+            if depth >= depth_limit:
+                raise _Deferred(wrapper, key, args, kwargs)
+            state.depth = depth + 1
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                state.depth = depth
+            stats["misses"] += 1
+            cache[key] = result
+            return result
+
+        # Outermost call: drive the explicit work stack
+        stack = [(key, args, kwargs)]
+        pending = {key}
+        try:
+            while stack:
+                top, top_args, top_kwargs = stack[-1]
+                state.depth = 1
+                try:
+                    result = func(*top_args, **top_kwargs)
+                except _Deferred as deferred:
+                    if deferred.owner is not wrapper:
+                        raise  # a miss of another memoize_deep function: its driver retries
+                    if deferred.key in pending:
+                        raise RecursionError(f"{func.__qualname__} depends on itself") from None
+                    stack.append((deferred.key, deferred.args_, deferred.kwargs))
+                    pending.add(deferred.key)
+                    continue
+                stats["misses"] += 1
+                cache[top] = result
+                stack.pop()
+                pending.discard(top)
+        finally:
+            state.depth = 0
+        return cache[key]
+
+    def cache_info() -> CacheInfo:
+        """Return hit/miss statistics (no evictions: the cache is unbounded)."""
+        return CacheInfo(stats["hits"], stats["misses"], 0, 0, len(cache), None)
+
+    def cache_clear() -> None:
+        """Remove every cached entry and reset the statistics."""
+        cache.clear()
+        stats["hits"] = stats["misses"] = 0
+
+    wrapper.cache_info = cache_info
+    wrapper.cache_clear = cache_clear
     return wrapper
 
 
+# ------------------------- Shared memory table -------------------------
+
+class SharedMemoTable:
+    """
+    Memo table in shared memory, read and written by all pool workers.
+
+    Layout: a header, then `sets` x `ways` fixed-size slots (set-associative
+    hash table). A slot holds a 64-bit tag (hash of the pickled key), the
+    pickled key and the pickled value; results that do not fit into a slot
+    are not stored.
+
+    - Reads take no lock: every slot has a sequence counter (seqlock) that a
+      writer makes odd while it writes; a reader retries when the counter
+      was odd or changed while it copied the slot.
+    - Writes are serialized by one multiprocessing lock.
+    - Bounded size, defined eviction: a new key replaces an empty way of
+      its set, otherwise the way written longest ago (FIFO per set, since
+      lock-free reads cannot update recency).
+
+    Create it in the parent and pass it to workers (e.g. via the pool
+    initializer); workers attach to the same block by name.
+    """
+
+    MAGIC = b"MEMO\x01\x00\x00\x00"
+    _HEADER = struct.Struct("<8sIIIIQ")  # magic, sets, ways, slot size, reserved, stamp
+    _SLOT = struct.Struct("<IIQQII")     # seq, key length, tag, stamp, value length, reserved
+    _SEQ = struct.Struct("<I")
+    _STAMP_OFFSET = 24
+
+    def __init__(self, sets: int = 4096, ways: int = 4, slot_size: int = 256,
+                 *, _name: Optional[str] = None, _lock: Any = None) -> None:
+        if _name is None:
+            if sets < 1 or ways < 1 or slot_size <= self._SLOT.size:
+                raise ValueError("sets, ways >= 1 and slot_size > slot header required")
+            size = self._HEADER.size + sets * ways * slot_size
+            self._block = shared_memory.SharedMemory(create=True, size=size)
+            self._HEADER.pack_into(self._block.buf, 0, self.MAGIC, sets, ways, slot_size, 0, 0)
+            self._lock = ProcessLock()
+            self._owner = True
+        else:
+            self._block = shared_memory.SharedMemory(name=_name)
+            magic, sets, ways, slot_size, _, _ = self._HEADER.unpack_from(self._block.buf, 0)
+            if magic != self.MAGIC:
+                self._block.close()
+                raise ValueError(f"{_name} is not a memo table")
+            self._lock = _lock
+            self._owner = False
+        self.sets, self.ways, self.slot_size = sets, ways, slot_size
+        self.capacity = slot_size - self._SLOT.size  # bytes for key + value
+        self._buf = self._block.buf
+
+    def __getstate__(self) -> Tuple[str, Any]:
+        # The lock pickles only while a process is being started
+        return self._block.name, self._lock
+
+    def __setstate__(self, state: Tuple[str, Any]) -> None:
+        name, lock = state
+        self.__init__(_name=name, _lock=lock)
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory block."""
+        return self._block.name
+
+    def __len__(self) -> int:
+        """Number of occupied slots."""
+        return sum(
+            self._SLOT.unpack_from(self._buf, self._offset(i))[2] != 0
+            for i in range(self.sets * self.ways)
+        )
+
+    @staticmethod
+    def _tag(blob: bytes) -> int:
+        # Stable across processes (unlike hash()); 0 marks an empty slot
+        return int.from_bytes(hashlib.blake2b(blob, digest_size=8).digest(), "little") or 1
+
+    def _offset(self, slot: int) -> int:
+        return self._HEADER.size + slot * self.slot_size
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return (found, value) without taking the lock; unpicklable keys miss."""
+        try:
+            blob = pickle.dumps(key, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False, None
+        tag = self._tag(blob)
+        buf, slot_header, seq = self._buf, self._SLOT, self._SEQ
+        first = (tag % self.sets) * self.ways
+        for slot in range(first, first + self.ways):
+            offset = self._offset(slot)
+            data_start = offset + slot_header.size
+            for _ in range(64):
+                before, key_length, slot_tag, _, value_length, _ = slot_header.unpack_from(
+                    buf, offset
+                )
+                if before & 1:
+                    continue  # a writer is inside this slot
+                if slot_tag != tag:
+                    break
+                end = data_start + min(key_length + value_length, self.capacity)
+                data = bytes(buf[data_start:end])
+                if seq.unpack_from(buf, offset)[0] != before:
+                    continue  # torn read, try again
+                if data[:key_length] == blob:
+                    return True, pickle.loads(data[key_length:])
+                break
+        return False, None
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """Store a result; return False if it cannot be pickled or does not fit."""
+        try:
+            blob = pickle.dumps(key, pickle.HIGHEST_PROTOCOL)
+            payload = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return False
+        if len(blob) + len(payload) > self.capacity:
+            return False
+        tag = self._tag(blob)
+        buf, slot_header, seq = self._buf, self._SLOT, self._SEQ
+        first = (tag % self.sets) * self.ways
+        with self._lock:
+            victim, oldest = first, None
+            for slot in range(first, first + self.ways):
+                offset = self._offset(slot)
+                _, key_length, slot_tag, stamp, _, _ = slot_header.unpack_from(buf, offset)
+                start = offset + slot_header.size
+                if slot_tag == tag and bytes(buf[start:start + key_length]) == blob:
+                    victim = slot  # same key: overwrite in place
+                    break
+                if slot_tag == 0:
+                    stamp = -1  # empty ways are used first
+                if oldest is None or stamp < oldest:
+                    victim, oldest = slot, stamp
+            stamp = struct.unpack_from("<Q", buf, self._STAMP_OFFSET)[0] + 1
+            struct.pack_into("<Q", buf, self._STAMP_OFFSET, stamp)
+
+            offset = self._offset(victim)
+            counter = seq.unpack_from(buf, offset)[0]
+            seq.pack_into(buf, offset, counter + 1)  # odd: readers back off
+            start = offset + slot_header.size
+            buf[start:start + len(blob)] = blob
+            buf[start + len(blob):start + len(blob) + len(payload)] = payload
+            slot_header.pack_into(buf, offset, counter + 1, len(blob), tag, stamp, len(payload), 0)
+            seq.pack_into(buf, offset, counter + 2)
+        return True
+
+    def close(self) -> None:
+        """Detach from the block; the creating process also frees it."""
+        self._buf = None
+        self._block.close()
+        if self._owner:
+            self._block.unlink()
+
+
+def shared_memoize(table: SharedMemoTable) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Return a decorator that caches results in a SharedMemoTable.
+
+    Keys are the function's qualified name plus make_key(args, kwargs), so
+    one table can serve several functions. cache_info() counts this
+    process's calls only; evictions are not tracked per process.
+    """
+    def decorate(func: Callable[..., Any]) -> Callable[..., Any]:
+        stats = {"hits": 0, "misses": 0}
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            key = (name, make_key(args, kwargs))
+            found, result = table.get(key)
+            if found:
+                stats["hits"] += 1
+                return result
+            stats["misses"] += 1
+            result = func(*args, **kwargs)
+            table.put(key, result)
+            return result
+
+        def cache_info() -> CacheInfo:
+            """Return this process's hit/miss statistics."""
+            return CacheInfo(stats["hits"], stats["misses"], 0, 0, len(table),
+                             table.sets * table.ways)
+
+        wrapper.cache_info = cache_info
+        return wrapper
+
+    return decorate
+
+
 @memoize
-def fib(n: int) -> int:
+def fib_recursive(n: int) -> int:
     """Compute n-th Fibonacci number (naive recursion)."""
     if n < 2:
         return n
-    return fib(n - 1) + fib(n - 2)
+    return fib_recursive(n - 1) + fib_recursive(n - 2)
+
+
+# ------------------------- Fast doubling -------------------------
+
+def _double(a: int, b: int, odd: int) -> Tuple[int, int]:
+    """(F(k), F(k+1)) -> (F(2k+odd), F(2k+odd+1))."""
+    c = a * (2 * b - a)  # F(2k)
+    d = a * a + b * b    # F(2k+1)
+    return (d, c + d) if odd else (c, d)
+
+
+def fib_pair(n: int) -> Tuple[int, int]:
+    """
+    Return (F(n), F(n+1)) by fast doubling.
+
+    Walks the bits of n from the most significant one: O(log n) big-int
+    multiplications, no recursion.
+    """
+    n = operator.index(n)
+    if n < 0:
+        raise ValueError("n must be >= 0")
+    a, b = 0, 1
+    for bit in bin(n)[2:]:
+        a, b = _double(a, b, bit == "1")
+    return a, b
+
+
+@memoize
+def fib(n: int) -> int:
+    """Compute n-th Fibonacci number (fast doubling, any n >= 0)."""
+    return fib_pair(n)[0]
+
+
+def fib_many(indices: Iterable[int], step_limit: int = 64) -> List[int]:
+    """
+    Fibonacci numbers for many indices, sharing intermediate results.
+
+    Indices are processed in sorted order, each one starting from the
+    previous result (F(last), F(last+1)):
+    - a gap of at most `step_limit` is walked by additions only;
+    - a gap d smaller than last uses F(last+d) = F(last+1)F(d) + F(last)F(d-1),
+      i.e. a few multiplications by the much shorter F(d);
+    - otherwise n is doubled up from the longest binary prefix (n >> s)
+      already computed in this batch.
+
+    Returns:
+        F(n) for every index, in the input order.
+
+    Raises:
+        ValueError: If an index is negative.
+    """
+    order = [operator.index(n) for n in indices]
+    if order and min(order) < 0:
+        raise ValueError("n must be >= 0")
+    prefixes: Dict[int, Tuple[int, int]] = {0: (0, 1)}
+    results: Dict[int, int] = {}
+    last, a, b = 0, 0, 1  # last computed index and (F(last), F(last+1))
+    for n in sorted(set(order)):
+        gap = n - last
+        if gap <= step_limit:
+            for _ in range(gap):
+                a, b = b, a + b
+        elif gap < last:
+            p, q = fib_pair(gap)  # F(gap), F(gap+1)
+            a, b = a * (q - p) + b * p, a * p + b * q
+        else:
+            path = []
+            k = n
+            while k not in prefixes:
+                path.append(k)
+                k >>= 1
+            a, b = prefixes[k]
+            for k in reversed(path):
+                a, b = prefixes[k] = _double(a, b, k & 1)
+        last = n
+        results[n] = a
+    return [results[n] for n in order]
+
+
+# ------------------------- Concurrency check -------------------------
+
+def check_single_flight(threads: int = 32) -> None:
+    """Many threads miss the same key at once; the function must run once."""
+    calls = 0
+
+    @memoize(maxsize=8)
+    def slow_square(x: int) -> int:
+        nonlocal calls
+        calls += 1
+        time.sleep(0.05)
+        return x * x
+
+    barrier = threading.Barrier(threads)
+    results: List[int] = []
+
+    def worker() -> None:
+        barrier.wait()
+        results.append(slow_square(12))
+
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    assert calls == 1 and results == [144] * threads, (calls, results)
+    print(f"Single flight: {threads} concurrent misses, 1 call;", slow_square.cache_info())
+
+
+# ------------------------- Disk tier benchmark -------------------------
+
+def _edit_distance(a: str, b: str) -> int:
+    """Levenshtein distance, O(len(a) * len(b)): an expensive pure function."""
+    previous = list(range(len(b) + 1))
+    for i, ca in enumerate(a, 1):
+        current = [i]
+        for j, cb in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (ca != cb)))
+        previous = current
+    return previous[-1]
+
+
+def benchmark_disk_tier(keys: int = 300, calls: int = 3_000, length: int = 120) -> None:
+    """
+    Cold versus warm start of a memoized function after a "restart".
+
+    Workload: edit distances between generated strings, requested with a
+    skewed (Zipf-like) popularity, as a lookup service would see it.
+    Every run decorates the function anew, i.e. starts with empty memory.
+    """
+    import random
+
+    rng = random.Random(7)
+    words = ["".join(rng.choice("ACGT") for _ in range(length)) for _ in range(keys + 1)]
+    pairs = [(words[i], words[i + 1]) for i in range(keys)]
+    requests = rng.choices(pairs, weights=[1 / (i + 1) for i in range(keys)], k=calls)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "memo.sqlite")
+        runs = [
+            ("memory only (cold)", {}),
+            ("disk, first run", {"disk": path}),
+            ("disk, restart", {"disk": path}),
+            ("disk, warm_start", {"disk": path, "warm_start": True}),
+        ]
+        print(f"{'run':<20} {'time, s':>8} {'misses':>7} {'disk hits':>9}")
+        for label, options in runs:
+            begin = time.perf_counter()
+            cached = memoize(_edit_distance, maxsize=keys, **options)
+            for a, b in requests:
+                cached(a, b)
+            elapsed = time.perf_counter() - begin
+            info = cached.cache_info()
+            print(f"{label:<20} {elapsed:>8.3f} {info.misses:>7} {info.disk_hits:>9}")
+            if cached.disk is not None:
+                cached.disk.close()
+
+
+# ------------------------- Fibonacci benchmark -------------------------
+
+def benchmark_fib(sizes: Tuple[int, ...] = (10**3, 10**4, 10**5, 10**6)) -> None:
+    """
+    Fast doubling against the memoized recursion, and batch against single calls.
+    """
+    def timed(run: Callable[[], Any]) -> Tuple[float, Any]:
+        begin = time.perf_counter()
+        result = run()
+        return time.perf_counter() - begin, result
+
+    # The recursion needs two frames per level: stay below the limit
+    depth = sys.getrecursionlimit() // 2 - 50
+    fib_recursive.cache_clear()
+    slow, expected = timed(lambda: fib_recursive(depth))
+    fast, result = timed(lambda: fib_pair(depth)[0])
+    assert result == expected
+    print(f"n={depth}: memoized recursion {slow:.5f} s, fast doubling {fast:.6f} s")
+    try:
+        fib_recursive(10 * depth)
+    except RecursionError:
+        print(f"n={10 * depth}: memoized recursion -> RecursionError")
+
+    print(f"{'n':>9} {'bits':>7} {'fib_pair, s':>12}")
+    for n in sizes:
+        elapsed, value = timed(lambda: fib_pair(n)[0])
+        print(f"{n:>9} {value.bit_length():>7} {elapsed:>12.4f}")
+
+    top = sizes[-1]
+    batches = {
+        "consecutive": list(range(top - 100, top)),
+        "scattered": [top - 997 * i for i in range(100)],
+        "spread": [top // 100 * i for i in range(1, 101)],
+    }
+    for label, indices in batches.items():
+        single, expected = timed(lambda: [fib_pair(n)[0] for n in indices])
+        batch, result = timed(lambda: fib_many(indices))
+        assert result == expected
+        print(f"{len(indices)} {label} indices up to {top}: "
+              f"single calls {single:.3f} s, fib_many {batch:.3f} s")
+
+
+# ------------------------- Deep recursion check -------------------------
+
+def check_deep_recursion(depth: int = 10**6, modulus: int = 1_000_000_007) -> None:
+    """
+    Same recursive function under memoize and memoize_deep.
+
+    Below the recursion limit both decorators must agree; at `depth`
+    the stack-safe one is compared with an iterative loop. Mutually
+    recursive is_even/is_odd check that deferred misses reach their own
+    driver.
+    """
+    def fib_mod(n: int) -> int:
+        if n < 2:
+            return n
+        return (wrapped(n - 1) + wrapped(n - 2)) % modulus
+
+    shallow = sys.getrecursionlimit() // 2 - 50
+    wrapped = memoize(fib_mod, maxsize=None)
+    expected = [wrapped(n) for n in range(shallow)]
+    wrapped = memoize_deep(fib_mod)
+    assert [wrapped(n) for n in range(shallow)] == expected
+    wrapped.cache_clear()
+
+    begin = time.perf_counter()
+    result = wrapped(depth)
+    elapsed = time.perf_counter() - begin
+    a, b = 0, 1
+    for _ in range(depth):
+        a, b = b, (a + b) % modulus
+    assert result == a, (result, a)
+    print(f"memoize_deep: fib_mod({depth}) = {result} on a cold cache in {elapsed:.2f} s;",
+          wrapped.cache_info())
+
+    @memoize_deep
+    def is_even(n: int) -> bool:
+        return True if n == 0 else is_odd(n - 1)
+
+    @memoize_deep
+    def is_odd(n: int) -> bool:
+        return False if n == 0 else is_even(n - 1)
+
+    begin = time.perf_counter()
+    assert is_even(1000) and not is_odd(1000)
+    assert is_even(depth) and is_odd(depth + 1)
+    elapsed = time.perf_counter() - begin
+    print(f"memoize_deep: mutual recursion is_even/is_odd({depth}) in {elapsed:.2f} s")
+
+
+# ------------------------- Shared table benchmark -------------------------
+
+_local_distance = memoize(_edit_distance, maxsize=None)  # one cache per worker
+_shared_distance: Optional[Callable[..., int]] = None
+
+
+def _init_shared_worker(table: SharedMemoTable) -> None:
+    """Pool initializer: attach this worker to the shared table."""
+    global _shared_distance
+    _shared_distance = shared_memoize(table)(_edit_distance)
+
+
+def _run_chunk(pairs: List[Tuple[str, str]], shared: bool) -> Tuple[int, int]:
+    """Worker task: evaluate a chunk of requests, return (hits, misses)."""
+    cached = _shared_distance if shared else _local_distance
+    before = cached.cache_info()
+    for a, b in pairs:
+        cached(a, b)
+    after = cached.cache_info()
+    return after.hits - before.hits, after.misses - before.misses
+
+
+def benchmark_shared_table(workers: int = 4, keys: int = 2_000, calls: int = 40_000,
+                           length: int = 40, chunk: int = 500) -> None:
+    """
+    Per-process memoize caches against one SharedMemoTable for a pool.
+
+    Same skewed edit-distance workload as benchmark_disk_tier, split in
+    chunks over `workers` processes. With per-process caches each worker
+    misses every key it meets once; with the shared table a key is
+    computed once for the whole pool (two workers may still race on it).
+    """
+    import random
+
+    rng = random.Random(11)
+    words = ["".join(rng.choice("ACGT") for _ in range(length)) for _ in range(keys + 1)]
+    pairs = [(words[i], words[i + 1]) for i in range(keys)]
+    requests = rng.choices(pairs, weights=[1 / (i + 1) for i in range(keys)], k=calls)
+    chunks = [requests[i:i + chunk] for i in range(0, calls, chunk)]
+
+    print(f"{'cache':<14} {'time, s':>8} {'calls/s':>9} {'hit rate':>9}")
+    table = SharedMemoTable(sets=1024, ways=4, slot_size=256)
+    try:
+        for label, shared in (("per-process", False), ("shared table", True)):
+            options = {"initializer": _init_shared_worker, "initargs": (table,)} if shared else {}
+            with ProcessPoolExecutor(max_workers=workers, **options) as pool:
+                begin = time.perf_counter()
+                counts = list(pool.map(_run_chunk, chunks, [shared] * len(chunks)))
+                elapsed = time.perf_counter() - begin
+            hits = sum(h for h, _ in counts)
+            print(f"{label:<14} {elapsed:>8.3f} {calls / elapsed:>9.0f} {hits / calls:>9.1%}")
+        print(f"shared table: {len(table)} of {table.sets * table.ways} slots used")
+    finally:
+        table.close()
+
 
+if __name__ == "__main__":
+    # Example usage
+    print(fib(3))   # перший виклик — обчислює і зберігає в кеш
+    print(fib(3))   # другий виклик — бере результат з кеша
+    print(fib.cache_info())  # hits: скільки разів результат взято з кеша
+    print(fib_many([10, 20, 30]))  # кілька індексів за один прохід
 
-# Example usage
-print(fib(3))   # перший виклик — обчислює і зберігає в кеш
-print(fib(3))   # другий виклик — бере результат з кеша
\ No newline at end of file
+    if "--bench" in sys.argv[1:]:
+        check_single_flight()
+        benchmark_disk_tier()
+        benchmark_fib()
+        check_deep_recursion()
+        benchmark_shared_table()
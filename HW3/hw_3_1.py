@@ -1,3 +1,15 @@
+import fractions
+import operator
+import sys
+import time
+from math import gcd
+from typing import Union
+
+# Hash parameters of the numeric tower, so Fraction(2, 1) hashes like 2
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+
 class Fraction:
     """
     Class to represent fractions (rational numbers).
@@ -7,50 +19,249 @@ class Fraction:
     - subtraction (sub)
     - multiplication (mul)
     - division (truediv)
+    - comparisons (eq, lt, le, gt, ge) and hashing
+    - int operands on either side (1 + Fraction(1, 2))
     Also implements repr for nice display like "numerator/denominator".
+
+    Fractions are always stored in lowest terms with a positive denominator,
+    so chained operations keep the integers small. Addition and subtraction
+    use the gcd-of-denominators algorithm of the stdlib fractions module.
     """
 
-    def __init__(self, numerator: int, denominator: int) -> None:
+    __slots__ = ("numerator", "denominator")
+
+    def __init__(self, numerator: int, denominator: int = 1) -> None:
+        numerator = operator.index(numerator)
+        denominator = operator.index(denominator)
         if denominator == 0:
             raise ValueError("Denominator cannot be zero")
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        g = gcd(numerator, denominator)
+        if g != 1:
+            numerator //= g
+            denominator //= g
         self.numerator = numerator
         self.denominator = denominator
 
-    def __add__(self, other: "Fraction") -> "Fraction":
-        """Addition of two fractions."""
-        new_num = self.numerator * other.denominator + other.numerator * self.denominator
-        new_den = self.denominator * other.denominator
-        return Fraction(new_num, new_den)
+    @classmethod
+    def _normalized(cls, numerator: int, denominator: int) -> "Fraction":
+        """Build a fraction already in lowest terms (no gcd, no checks)."""
+        result = object.__new__(cls)
+        result.numerator = numerator
+        result.denominator = denominator
+        return result
+
+    @staticmethod
+    def _coerce(other: object) -> Union["Fraction", None]:
+        """Return other as a Fraction, or None for unsupported types."""
+        if isinstance(other, Fraction):
+            return other
+        if isinstance(other, int):
+            return Fraction._normalized(int(other), 1)
+        return None
+
+    def _add(self, other: "Fraction", sign: int) -> "Fraction":
+        """self + sign * other in lowest terms."""
+        na, da = self.numerator, self.denominator
+        nb, db = other.numerator, other.denominator
+        if db == 1:
+            # Small-int fast path: (na + nb*da) / da is already reduced
+            return Fraction._normalized(na + sign * nb * da, da)
+        g = gcd(da, db)
+        if g == 1:
+            return Fraction._normalized(na * db + sign * da * nb, da * db)
+        s = da // g
+        t = na * (db // g) + sign * nb * s
+        g2 = gcd(t, g)
+        if g2 == 1:
+            return Fraction._normalized(t, s * db)
+        return Fraction._normalized(t // g2, s * (db // g2))
+
+    def __add__(self, other: Union["Fraction", int]) -> "Fraction":
+        """Addition of two fractions (or a fraction and an int)."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._add(other, 1)
 
-    def __sub__(self, other: "Fraction") -> "Fraction":
-        """Subtraction of two fractions."""
-        new_num = self.numerator * other.denominator - other.numerator * self.denominator
-        new_den = self.denominator * other.denominator
-        return Fraction(new_num, new_den)
+    __radd__ = __add__
 
-    def __mul__(self, other: "Fraction") -> "Fraction":
-        """Multiplication of two fractions."""
-        return Fraction(self.numerator * other.numerator, self.denominator * other.denominator)
+    def __sub__(self, other: Union["Fraction", int]) -> "Fraction":
+        """Subtraction of two fractions (or a fraction and an int)."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self._add(other, -1)
 
-    def __truediv__(self, other: "Fraction") -> "Fraction":
-        """Division of two fractions."""
+    def __rsub__(self, other: int) -> "Fraction":
+        """int - fraction."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return other._add(self, -1)
+
+    def __mul__(self, other: Union["Fraction", int]) -> "Fraction":
+        """Multiplication of two fractions (or a fraction and an int)."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        na, da = self.numerator, self.denominator
+        nb, db = other.numerator, other.denominator
+        g1 = gcd(na, db)
+        g2 = gcd(nb, da)
+        if g1 > 1:
+            na //= g1
+            db //= g1
+        if g2 > 1:
+            nb //= g2
+            da //= g2
+        return Fraction._normalized(na * nb, da * db)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other: Union["Fraction", int]) -> "Fraction":
+        """Division of two fractions (or a fraction and an int)."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
         if other.numerator == 0:
             raise ZeroDivisionError("Cannot divide by a fraction with numerator 0")
-        return Fraction(self.numerator * other.denominator, self.denominator * other.numerator)
+        numerator, denominator = other.denominator, other.numerator  # reciprocal
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        return self * Fraction._normalized(numerator, denominator)
+
+    def __rtruediv__(self, other: int) -> "Fraction":
+        """int / fraction."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return other / self
+
+    # Comparisons: denominators are positive, so cross-multiplying keeps the order
+    def __eq__(self, other: object) -> bool:
+        """Check if two fractions (or a fraction and an int) are equal."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        # Both sides are in lowest terms: equal values have equal parts
+        return self.numerator == other.numerator and self.denominator == other.denominator
+
+    def __lt__(self, other: Union["Fraction", int]) -> bool:
+        """Check if this fraction is less than another."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self.numerator * other.denominator < other.numerator * self.denominator
+
+    def __le__(self, other: Union["Fraction", int]) -> bool:
+        """Check if this fraction is less than or equal to another."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self.numerator * other.denominator <= other.numerator * self.denominator
+
+    def __gt__(self, other: Union["Fraction", int]) -> bool:
+        """Check if this fraction is greater than another."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self.numerator * other.denominator > other.numerator * self.denominator
+
+    def __ge__(self, other: Union["Fraction", int]) -> bool:
+        """Check if this fraction is greater than or equal to another."""
+        other = self._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self.numerator * other.denominator >= other.numerator * self.denominator
+
+    def __hash__(self) -> int:
+        """Hash equal to hash() of an equal int or fractions.Fraction."""
+        try:
+            inverse = pow(self.denominator, -1, _HASH_MODULUS)
+        except ValueError:
+            # Denominator divisible by the modulus: no inverse
+            value = _HASH_INF
+        else:
+            value = hash(hash(abs(self.numerator)) * inverse)
+        result = value if self.numerator >= 0 else -value
+        return -2 if result == -1 else result
 
     def __repr__(self) -> str:
         """String representation in 'numerator/denominator' format."""
         return f"{self.numerator}/{self.denominator}"
 
 
-# Example usage
-f1 = Fraction(1, 2)   # 1/2
-f2 = Fraction(3, 4)   # 3/4
+# ------------------------- Benchmark -------------------------
+
+class _UnreducedFraction:
+    """The previous Fraction addition: multiplies denominators, never reduces."""
+
+    __slots__ = ("numerator", "denominator")
+
+    def __init__(self, numerator: int, denominator: int) -> None:
+        self.numerator = numerator
+        self.denominator = denominator
+
+    def __add__(self, other: "_UnreducedFraction") -> "_UnreducedFraction":
+        return _UnreducedFraction(
+            self.numerator * other.denominator + other.numerator * self.denominator,
+            self.denominator * other.denominator,
+        )
+
+
+def benchmark_sums(lengths: tuple = (100, 1_000, 3_000)) -> None:
+    """
+    Time long sum chains for the unreduced class, this Fraction and
+    fractions.Fraction, and show how many bits the final denominator has.
+
+    Chains: the harmonic series 1/1 + 1/2 + ... + 1/n, and prices in
+    eighths k/8, whose exact sum always has a denominator dividing 8.
+    """
+    chains = {
+        "harmonic": lambda n: [(1, k) for k in range(1, n + 1)],
+        "eighths": lambda n: [(k % 13 + 1, 8) for k in range(n)],
+    }
+    classes = {
+        "unreduced": _UnreducedFraction,
+        "Fraction": Fraction,
+        "fractions": fractions.Fraction,
+    }
+    print(f"{'chain':<9} {'n':>6} {'class':<10} {'time, s':>9} {'den. bits':>10}")
+    for chain, make in chains.items():
+        for n in lengths:
+            terms = make(n)
+            expected = None
+            for label, cls in classes.items():
+                values = [cls(a, b) for a, b in terms]
+                begin = time.perf_counter()
+                total = values[0]
+                for value in values[1:]:
+                    total = total + value
+                elapsed = time.perf_counter() - begin
+                exact = fractions.Fraction(total.numerator, total.denominator)
+                if expected is None:
+                    expected = exact
+                assert exact == expected
+                bits = total.denominator.bit_length()
+                print(f"{chain:<9} {n:>6} {label:<10} {elapsed:>9.4f} {bits:>10}")
+
+
+if __name__ == "__main__":
+    # Example usage
+    f1 = Fraction(1, 2)   # 1/2
+    f2 = Fraction(3, 4)   # 3/4
+
+    print("f1:", f1)
+    print("f2:", f2)
 
-print("f1:", f1)
-print("f2:", f2)
+    print("Addition:", f1 + f2)       # 1/2 + 3/4 = 5/4
+    print("Subtraction:", f1 - f2)    # 1/2 - 3/4 = -1/4
+    print("Multiplication:", f1 * f2) # 1/2 * 3/4 = 3/8
+    print("Division:", f1 / f2)       # 1/2 ÷ 3/4 = 2/3
+    print("With int:", 1 + f1)        # 1 + 1/2 = 3/2
+    print("Comparison:", f1 < f2, Fraction(2, 4) == f1)  # True True
 
-print("Addition:", f1 + f2)       # 1/2 + 3/4 = 10/8
-print("Subtraction:", f1 - f2)    # 1/2 - 3/4 = -2/8
-print("Multiplication:", f1 * f2) # 1/2 * 3/4 = 3/8
-print("Division:", f1 / f2)       # 1/2 ÷ 3/4 = 4/6
+    if "--bench" in sys.argv[1:]:
+        benchmark_sums()